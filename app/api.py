@@ -8,16 +8,15 @@ import logging
 import re
 import sqlite3
 from datetime import UTC, datetime
-from pathlib import Path
 from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Form, Request
 from fastapi.responses import HTMLResponse
-from fastapi.templating import Jinja2Templates
 
 from .database import get_db
 from .gitea import Sprint, get_client
 from .sprint_store import SprintStore
+from .templating import templates
 
 if TYPE_CHECKING:
     from .gitea import GiteaClient
@@ -25,8 +24,6 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
-templates_dir = Path(__file__).parent.parent / "templates"
-templates = Jinja2Templates(directory=templates_dir)
 
 
 _DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
@@ -454,9 +451,9 @@ async def _board_partial(
     request: Request, owner: str, repo: str, store: SprintStore, client: GiteaClient
 ) -> HTMLResponse:
     """Return updated board content partial after a write operation."""
-    from .main import _build_board_data, _sort_board_issues
+    from .main import _get_board_data, _sort_board_issues
 
-    board_data = _build_board_data(store, client)
+    board_data = await _get_board_data(store, client)
 
     # Build minimal board context
     ready_backlog = [i for i in board_data.backlog if i.is_ready]
@@ -6,11 +6,14 @@ Used by sd-cli HTTP client and any future integrations.
 
 from __future__ import annotations
 
+import hashlib
 import logging
 import sqlite3
 from datetime import UTC, datetime
+from typing import Any
 
-from fastapi import APIRouter, Request
+import orjson
+from fastapi import APIRouter, Query, Request
 from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field, field_validator
 
@@ -88,6 +91,18 @@ class IssueAdd(BaseModel):
         return v
 
 
+class IssueRemove(BaseModel):
+    issues: list[int] = Field(min_length=1)
+
+    @field_validator("issues")
+    @classmethod
+    def check_positive_issues(cls, v: list[int]) -> list[int]:
+        if any(n <= 0 for n in v):
+            msg = "All issue numbers must be positive integers"
+            raise ValueError(msg)
+        return v
+
+
 class IssueMove(BaseModel):
     issues: list[int] = Field(min_length=1)
     from_sprint: int = Field(gt=0)
@@ -109,6 +124,20 @@ def _get_store(owner: str, repo: str) -> SprintStore:
     return SprintStore(get_db(), owner, repo)
 
 
+def _conditional_json(request: Request, data: Any) -> Response:
+    """Encode data as JSON with a content ETag.
+
+    Returns an empty 304 when the client's If-None-Match already matches,
+    so polling clients don't re-download unchanged sprints.
+    """
+    body = orjson.dumps(data)
+    etag = f'"{hashlib.blake2s(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
+
+
 def _error(message: str, code: str, status: int) -> JSONResponse:
     return JSONResponse({"error": message, "code": code}, status_code=status)
 
@@ -131,11 +160,15 @@ def _handle_exception(e: Exception) -> JSONResponse:
 
 @router.get("/{owner}/{repo}/api/v1/sprints")
 async def list_sprints(
-    request: Request, owner: str, repo: str, status: str | None = None
+    request: Request,
+    owner: str,
+    repo: str,
+    status: str | None = None,
+    limit: int | None = Query(default=None, ge=1),
 ):
     store = _get_store(owner, repo)
-    sprints = store.list_sprints(status=status)
-    return sprints
+    sprints = store.list_sprints(status=status, limit=limit)
+    return _conditional_json(request, sprints)
 
 
 @router.get("/{owner}/{repo}/api/v1/sprints/current")
@@ -145,7 +178,7 @@ async def current_sprint(request: Request, owner: str, repo: str):
     if number is None:
         return _error("No sprint in progress", "not_found", 404)
     sprint = store.get_sprint(number)
-    return sprint
+    return _conditional_json(request, sprint)
 
 
 @router.get("/{owner}/{repo}/api/v1/sprints/{n}")
@@ -164,7 +197,7 @@ async def get_sprint(request: Request, owner: str, repo: str, n: int):
     result["issue_count"] = len(issues)
     result["start_snapshot"] = _clean_snapshot(start_snapshot)
     result["end_snapshot"] = _clean_snapshot(end_snapshot)
-    return result
+    return _conditional_json(request, result)
 
 
 def _clean_snapshot(snap: dict | None) -> dict | None:
@@ -282,7 +315,9 @@ async def list_issues(request: Request, owner: str, repo: str, n: int):
     if not sprint:
         return _error(f"Sprint {n} not found", "not_found", 404)
     issues = store.get_issue_numbers(n)
-    return {"sprint": n, "issues": issues, "count": len(issues)}
+    return _conditional_json(
+        request, {"sprint": n, "issues": issues, "count": len(issues)}
+    )
 
 
 @router.post("/{owner}/{repo}/api/v1/sprints/{n}/issues")
@@ -295,13 +330,7 @@ async def add_issues(request: Request, owner: str, repo: str, n: int, body: Issu
     # Deduplicate issue list
     unique_issues = list(dict.fromkeys(body.issues))
 
-    added = []
-    failed = []
-    for num in unique_issues:
-        if store.add_issue(n, num, source=body.source):
-            added.append(num)
-        else:
-            failed.append(num)
+    added, failed = store.add_issues(n, unique_issues, source=body.source)
 
     if failed:
         return JSONResponse(
@@ -327,6 +356,29 @@ async def remove_issue(request: Request, owner: str, repo: str, n: int, issue: i
     return Response(status_code=204)
 
 
+@router.post("/{owner}/{repo}/api/v1/sprints/{n}/issues/remove")
+async def remove_issues(
+    request: Request, owner: str, repo: str, n: int, body: IssueRemove
+):
+    store = _get_store(owner, repo)
+    sprint = store.get_sprint(n)
+    if not sprint:
+        return _error(f"Sprint {n} not found", "not_found", 404)
+
+    removed, failed = store.remove_issues(n, list(dict.fromkeys(body.issues)))
+    if failed:
+        return JSONResponse(
+            {
+                "error": f"Issues not found in sprint {n}: {failed}",
+                "code": "not_found",
+                "removed": removed,
+                "failed": failed,
+            },
+            status_code=404,
+        )
+    return {"sprint": n, "removed": removed}
+
+
 @router.post("/{owner}/{repo}/api/v1/issues/move")
 async def move_issues(request: Request, owner: str, repo: str, body: IssueMove):
     store = _get_store(owner, repo)
@@ -353,13 +405,7 @@ async def move_issues(request: Request, owner: str, repo: str, body: IssueMove):
             status_code=400,
         )
 
-    moved = []
-    failed = []
-    for num in unique_issues:
-        if store.move_issue(num, body.from_sprint, body.to_sprint):
-            moved.append(num)
-        else:
-            failed.append(num)
+    moved, failed = store.move_issues(unique_issues, body.from_sprint, body.to_sprint)
 
     if failed:
         return JSONResponse(
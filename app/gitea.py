@@ -1,24 +1,178 @@
 """Gitea API client for sprint data."""
 
+import hashlib
 import logging
 import os
 import re
+import sqlite3
+import sys
+import threading
+import time
 import warnings
-from dataclasses import dataclass
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
+from functools import cached_property, lru_cache
+from itertools import chain
 from pathlib import Path
+from typing import Any, NamedTuple
 
 import httpx
+import orjson
 import yaml
-from cachetools import TTLCache
+from cachetools import LFUCache, LRUCache, TTLCache
+
+# Prefer libyaml's C loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depends on PyYAML build
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
 
 logger = logging.getLogger(__name__)
 
-# Module-level cache for API responses (60-second TTL)
+
+def env_ttl(name: str, default: float) -> float:
+    """Read a cache TTL in seconds from the environment.
+
+    Falls back to the default (with a warning) if the value isn't a
+    positive number.
+    """
+    raw = os.environ.get(name, "").strip()
+    if not raw:
+        return default
+    try:
+        ttl = float(raw)
+    except ValueError:
+        ttl = 0
+    if ttl <= 0:
+        logger.warning(f"Ignoring invalid {name}={raw!r}; using {default}s")
+        return default
+    return ttl
+
+
+# Cache TTLs (seconds), tuned to how often each kind of data changes:
+# issues move around within a sprint, milestones change about once a sprint
+ISSUES_TTL = env_ttl("SPRINT_DASH_ISSUES_TTL", 60)
+MILESTONES_TTL = env_ttl("SPRINT_DASH_MILESTONES_TTL", 600)
+
+# Module-level cache for API responses
 # Cache keys include base_url and repo identifier to support multi-instance scenarios
 _issues_cache: TTLCache[
     tuple[str | None, str | None, str | None, str, str | None], list["Issue"]
-] = TTLCache(maxsize=100, ttl=60)
+] = TTLCache(maxsize=100, ttl=ISSUES_TTL)
+
+
+class _IssuePage(NamedTuple):
+    """One page of an issue listing, with its validator for revalidation."""
+
+    etag: str | None
+    issues: list["Issue"]
+    total: str  # X-Total-Count header ("" if absent)
+
+
+# Last fetched pages per issues query, retained after the TTL above expires so
+# the next fetch can revalidate with If-None-Match instead of re-downloading
+_issues_etag_cache: LRUCache[
+    tuple[str | None, str | None, str | None, str, str | None],
+    tuple[tuple[_IssuePage, ...], list["Issue"]],
+] = LRUCache(maxsize=100)
+
+# Guards both issue caches (cachetools caches aren't thread-safe, and handlers
+# run on FastAPI's threadpool) plus the in-flight fetches. A query being
+# fetched has a Future here, so concurrent misses wait for that one fetch
+# instead of each paging through the listing themselves.
+_issues_lock = threading.Lock()
+_issues_inflight: dict[
+    tuple[str | None, str | None, str | None, str, str | None],
+    Future[list["Issue"]],
+] = {}
+
+
+class _IssuePageStore:
+    """On-disk copy of the issue pages in _issues_etag_cache.
+
+    Keeps each page's raw JSON and ETag in SQLite so a restarted (or second)
+    process can revalidate with If-None-Match instead of downloading every
+    page again. Best-effort: storage errors are logged and ignored.
+    """
+
+    _SCHEMA = """
+    CREATE TABLE IF NOT EXISTS issue_pages (
+        query TEXT NOT NULL,
+        page INTEGER NOT NULL,
+        etag TEXT NOT NULL,
+        total TEXT NOT NULL,
+        body BLOB NOT NULL,
+        PRIMARY KEY (query, page)
+    )
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.path, timeout=5)
+        if not self._ready:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(self._SCHEMA)
+            self._ready = True
+        return conn
+
+    def load(self, query: str) -> tuple[_IssuePage, ...] | None:
+        """Pages stored for a query, in order, or None if there are none."""
+        try:
+            with closing(self._connect()) as conn:
+                rows = conn.execute(
+                    "SELECT etag, total, body FROM issue_pages "
+                    "WHERE query = ? ORDER BY page",
+                    (query,),
+                ).fetchall()
+            return (
+                tuple(
+                    _IssuePage(
+                        etag=etag,
+                        issues=[_parse_issue(item) for item in orjson.loads(body)],
+                        total=total,
+                    )
+                    for etag, total, body in rows
+                )
+                or None
+            )
+        except (sqlite3.Error, orjson.JSONDecodeError, KeyError, TypeError) as e:
+            logger.debug(f"Could not load cached issue pages: {e}")
+            return None
+
+    def save(
+        self, query: str, page_count: int, fresh: dict[int, tuple[str, str, bytes]]
+    ) -> None:
+        """Store freshly downloaded pages and drop any past page_count."""
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.execute(
+                    "DELETE FROM issue_pages WHERE query = ? AND page > ?",
+                    (query, page_count),
+                )
+                conn.executemany(
+                    "INSERT OR REPLACE INTO issue_pages VALUES (?, ?, ?, ?, ?)",
+                    [
+                        (query, n, etag, total, body)
+                        for n, (etag, total, body) in fresh.items()
+                        if n <= page_count
+                    ],
+                )
+        except sqlite3.Error as e:
+            logger.debug(f"Could not store issue pages: {e}")
+
+
+# Optional persistent layer under _issues_etag_cache (unset = memory only)
+HTTP_CACHE_PATH = os.environ.get("SPRINT_DASH_HTTP_CACHE", "").strip()
+_issue_page_store: _IssuePageStore | None = (
+    _IssuePageStore(HTTP_CACHE_PATH) if HTTP_CACHE_PATH else None
+)
 
 # Pagination limits
 MAX_PAGES = 100
@@ -54,30 +208,74 @@ NIGHTLY_WORKFLOWS: tuple[tuple[str, str, str, str], ...] = (
     ("Q", "nightly-quality", "Quality", "Issues found — review quality logs"),
 )
 
-# Cache for dependency counts (repo:issue_number -> (blocked_by_count, blocks_count, blockers_list))
-_deps_cache: TTLCache[str, tuple[int, int, list[tuple[int, str, int | None]]]] = (
-    TTLCache(maxsize=500, ttl=60)
+# Cache for dependency counts (repo:issue_number -> (fetched_at, (blocked_by_count,
+# blocks_count, blockers_list))). LFU keeps current-sprint issues, which are read on
+# every render, resident over rarely viewed backlog blockers; freshness is checked
+# manually against DEPS_TTL since LFUCache has no expiry of its own.
+DEPS_TTL = env_ttl("SPRINT_DASH_DEPS_TTL", 60)
+_deps_cache: LFUCache[
+    str, tuple[float, tuple[int, int, list[tuple[int, str, int | None]]]]
+] = LFUCache(maxsize=500)
+
+# Shared pool for overlapping independent Gitea round-trips (httpx.Client is
+# thread-safe, so workers share the calling client's connection pool)
+_fetch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gitea-fetch")
+# Separate pool for list pagination, so page fetches never queue behind (or
+# wait on) dependency lookups already occupying _fetch_pool
+_page_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="gitea-page")
+
+# Milestone cache
+_milestones_cache: TTLCache[str, list["Milestone"]] = TTLCache(
+    maxsize=10, ttl=MILESTONES_TTL
+)
+# (ETag, milestones) from the last fetch, for If-None-Match revalidation
+_milestones_etag_cache: LRUCache[str, tuple[str, list["Milestone"]]] = LRUCache(
+    maxsize=10
 )
-
-# Cache for epic -> color mapping (built per board load)
-_epic_colors: dict[str, str] = {}
-
-# Milestone cache (60s TTL)
-_milestones_cache: TTLCache[str, list["Milestone"]] = TTLCache(maxsize=10, ttl=60)
 
 # User repos cache (5 minute TTL - repos don't change often)
 _user_repos_cache: TTLCache[str, list[dict[str, str]]] = TTLCache(maxsize=1, ttl=300)
 
+# Lowercased titles per issue list, keyed by the list's id(). _get_issues hands
+# out the same list object for as long as it's cached (and across unchanged
+# revalidations), so repeated searches skip re-lowering every title.
+_title_index: LRUCache[int, tuple[list["Issue"], list[str]]] = LRUCache(maxsize=16)
+
+# Guards the dependency, milestone, user-repo and title caches: page handlers
+# run on worker threads and cachetools caches aren't thread-safe. Only held
+# around cache reads and writes, never across a request.
+_cache_lock = threading.Lock()
 
+
+@lru_cache(maxsize=128)
 def get_epic_color(epic_name: str | None) -> str:
-    """Get a consistent color for an epic."""
+    """Get a consistent color for an epic.
+
+    The color comes from a hash of the name (blake2s rather than hash(), which
+    is salted per process), so every worker and every restart agrees on it
+    without any shared state.
+    """
     if not epic_name:
         return "transparent"
-    if epic_name not in _epic_colors:
-        # Assign next available color
-        idx = len(_epic_colors) % len(EPIC_COLORS)
-        _epic_colors[epic_name] = EPIC_COLORS[idx]
-    return _epic_colors[epic_name]
+    digest = hashlib.blake2s(epic_name.encode(), digest_size=4).digest()
+    return EPIC_COLORS[int.from_bytes(digest, "little") % len(EPIC_COLORS)]
+
+
+def filter_by_title(issues: list["Issue"], query: str) -> list["Issue"]:
+    """Issues whose title contains query, case-insensitively."""
+    with _cache_lock:
+        entry = _title_index.get(id(issues))
+    # The identity check guards against a recycled id() from a freed list
+    if entry is None or entry[0] is not issues:
+        entry = (issues, [issue.title.lower() for issue in issues])
+        with _cache_lock:
+            _title_index[id(issues)] = entry
+    query_lower = query.lower()
+    return [
+        issue
+        for issue, title in zip(issues, entry[1], strict=True)
+        if query_lower in title
+    ]
 
 
 def _get_ssl_verify() -> bool | str:
@@ -122,6 +320,22 @@ def _get_tea_config_path() -> Path:
     return Path.home() / ".config" / "tea" / "config.yml"
 
 
+@lru_cache(maxsize=4)
+def _parse_tea_config(path: str, mtime_ns: int, size: int) -> dict | None:
+    """Parse tea's config file, memoized on its stat signature.
+
+    The mtime and size are only part of the cache key, so editing the file
+    (e.g. `tea login add`) invalidates the cached result.
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            result = yaml.load(f, Loader=_SafeLoader)
+            return result if isinstance(result, dict) else None
+    except (yaml.YAMLError, PermissionError, OSError) as e:
+        logger.debug(f"Could not load tea config: {e}")
+        return None
+
+
 def _load_tea_config() -> dict | None:
     """Load tea configuration from YAML file.
 
@@ -130,17 +344,13 @@ def _load_tea_config() -> dict | None:
     """
     path = _get_tea_config_path()
 
-    if not path.exists():
-        return None
-
     try:
-        with path.open(encoding="utf-8") as f:
-            result = yaml.safe_load(f)
-            return result if isinstance(result, dict) else None
-    except (yaml.YAMLError, PermissionError, OSError) as e:
-        logger.debug(f"Could not load tea config: {e}")
+        st = path.stat()
+    except OSError:
         return None
 
+    return _parse_tea_config(os.path.normpath(path), st.st_mtime_ns, st.st_size)
+
 
 def _get_tea_login(login_name: str | None = None) -> dict | None:
     """Get a tea login configuration.
@@ -193,10 +403,145 @@ def _normalize_base_url(url: str) -> str:
     return url + "/api/v1"
 
 
+# Effort section in an issue body: "## Effort: S", "## Effort\nS", "**Effort:** M"
+_EFFORT_RE = re.compile(
+    r"(?:##\s*Effort[:\s]*|\*\*Effort:?\*\*[:\s]*)(XL|[SMLsml])\b", re.IGNORECASE
+)
+
+
+def _is_word_char(text: str, i: int) -> bool:
+    """True if text[i] exists and is a regex word character."""
+    return i < len(text) and (text[i].isalnum() or text[i] == "_")
+
+
+def _parse_effort(body: str) -> str | None:
+    """Extract an effort size (S/M/L/XL) from an issue body.
+
+    Equivalent to searching with _EFFORT_RE, but most bodies have no effort
+    section at all, so ASCII bodies are rejected with a plain substring
+    search and otherwise tokenised by hand. Non-ASCII bodies go through the
+    regex, whose case-insensitive matching also covers Unicode case folding.
+    """
+    if not body.isascii():
+        match = _EFFORT_RE.search(body)
+        return match.group(1).upper() if match else None
+
+    text = body.lower()
+    i = text.find("effort")
+    while i != -1:
+        j = i + len("effort")
+        k = i
+        while k > 0 and text[k - 1].isspace():
+            k -= 1
+        if k >= 2 and text[k - 2 : k] == "##":
+            valid = True
+        elif i >= 2 and text[i - 2 : i] == "**":
+            if text.startswith(":", j):
+                j += 1
+            valid = text.startswith("**", j)
+            j += 2
+        else:
+            valid = False
+
+        if valid:
+            while j < len(text) and (text[j] == ":" or text[j].isspace()):
+                j += 1
+            if text.startswith("xl", j) and not _is_word_char(text, j + 2):
+                return "XL"
+            if j < len(text) and text[j] in "sml" and not _is_word_char(text, j + 1):
+                return text[j].upper()
+        i = text.find("effort", i + 1)
+    return None
+
+
+_SPRINT_LABEL_RE = re.compile(r"sprint/(\d+)")
+_MILESTONE_SPRINT_RE = re.compile(r"Sprint (\d+)")
+_ISSUE_NUMBER_QUERY_RE = re.compile(r"#?(\d+)")
+_PRIORITY_LABELS = {"P1": 1, "P2": 2, "P3": 3}
+_ISSUE_TYPES = frozenset(
+    ("bug", "feature", "tech-debt", "chore", "docs", "hotfix", "epic")
+)
+
+
+def _sprint_from_label(label: str) -> int | None:
+    """Sprint number from a 'sprint/N' label, or None if it isn't one.
+
+    The plain 'sprint/<digits>' form is handled with string ops; anything
+    else (e.g. 'sprint/12-hotfix') goes through the regex, which accepts a
+    leading number.
+    """
+    rest = label[7:]
+    if label.startswith("sprint/") and rest.isdecimal():
+        return int(rest)
+    match = _SPRINT_LABEL_RE.match(label)
+    return int(match.group(1)) if match else None
+
+
+def _sprint_from_labels(labels: Iterable[str]) -> int | None:
+    """Sprint number from the first 'sprint/N' label, stopping at it."""
+    for label in labels:
+        if label.startswith("sprint/"):
+            sprint = _sprint_from_label(label)
+            if sprint is not None:
+                return sprint
+    return None
+
+
+class _LabelInfo(NamedTuple):
+    """Everything Issue derives from its labels, gathered in one pass."""
+
+    sprint: int | None
+    size: str | None
+    priority: int | None
+    epic: str | None
+    issue_type: str
+    is_ready: bool
+    needs_polish: bool
+    is_epic_tracking: bool
+
+
+@lru_cache(maxsize=1024)
+def _classify_labels(labels: tuple[str, ...]) -> _LabelInfo:
+    """Walk an issue's labels once; the first match wins for each field.
+
+    Memoized on the label tuple: issues in the same sprint tend to carry
+    identical label sets, and the result is an immutable NamedTuple.
+    """
+    sprint: int | None = None
+    size: str | None = None
+    priority: int | None = None
+    epic: str | None = None
+    issue_type: str | None = None
+    for label in labels:
+        if label.startswith("sprint/"):
+            if sprint is None:
+                sprint = _sprint_from_label(label)
+        elif label.startswith("size/"):
+            if size is None:
+                size = label.split("/")[1].upper()
+        elif label.startswith("epic/"):
+            if epic is None:
+                epic = label[5:]
+        elif priority is None and label in _PRIORITY_LABELS:
+            priority = _PRIORITY_LABELS[label]
+        if issue_type is None and label in _ISSUE_TYPES:
+            issue_type = label
+    return _LabelInfo(
+        sprint=sprint,
+        size=size,
+        priority=priority,
+        epic=epic,
+        issue_type=issue_type or "unknown",
+        is_ready="ready" in labels,
+        needs_polish="needs-polish" in labels,
+        is_epic_tracking="epic" in labels,
+    )
+
+
 # --- Data Models ---
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Comment:
     id: int
     body: str
@@ -205,7 +550,7 @@ class Comment:
     updated_at: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Dependency:
     """Represents a dependency link between issues."""
 
@@ -223,7 +568,12 @@ class Dependency:
         return self.state == "closed"
 
 
-@dataclass
+# Blocker sprint contexts, most relevant first; "" when none apply
+# (see BoardIssue.blocker_context)
+_BLOCKER_CONTEXTS = ("S-1", "BL", "S0", "S+1", "")
+
+
+@dataclass(slots=True)
 class BoardIssue:
     """Issue wrapper with dependency info for board display."""
 
@@ -253,42 +603,103 @@ class BoardIssue:
         if not self.blockers:
             return ""
         current_sprint = self.issue.sprint
-        contexts = []
+        # Most relevant context wins: S-1, then BL, then S0, then S+1. Without
+        # a current sprint only backlog blockers have a context.
+        best = len(_BLOCKER_CONTEXTS) - 1
         for _, state, blocker_sprint in self.blockers:
             if state != "open":
                 continue
             if blocker_sprint is None:
-                contexts.append("BL")
+                rank = 1
             elif current_sprint is None:
-                contexts.append(f"S{blocker_sprint}")
+                continue
             elif blocker_sprint < current_sprint:
-                contexts.append("S-1")
+                return "S-1"
             elif blocker_sprint == current_sprint:
-                contexts.append("S0")
+                rank = 2
             else:
-                contexts.append("S+1")
-        # Return most relevant context
-        if "S-1" in contexts:
-            return "S-1"
-        if "BL" in contexts:
-            return "BL"
-        if "S0" in contexts:
-            return "S0"
-        if "S+1" in contexts:
-            return "S+1"
-        return ""
+                rank = 3
+            if rank < best:
+                best = rank
+        return _BLOCKER_CONTEXTS[best]
 
     @property
     def epic_color(self) -> str:
         """Get the color for this issue's epic."""
         return get_epic_color(self.issue.epic)
 
-    # Delegate common properties to the wrapped issue
-    def __getattr__(self, name: str):
-        return getattr(self.issue, name)
+    # Explicit forwarding to the wrapped issue. Templates read many of these per
+    # card, and named properties avoid a __getattr__ fallback on every access.
+    @property
+    def number(self) -> int:
+        return self.issue.number
+
+    @property
+    def title(self) -> str:
+        return self.issue.title
+
+    @property
+    def state(self) -> str:
+        return self.issue.state
+
+    @property
+    def labels(self) -> tuple[str, ...]:
+        return self.issue.labels
+
+    @property
+    def created_at(self) -> str:
+        return self.issue.created_at
+
+    @property
+    def updated_at(self) -> str:
+        return self.issue.updated_at
+
+    @property
+    def closed_at(self) -> str | None:
+        return self.issue.closed_at
+
+    @property
+    def body(self) -> str:
+        return self.issue.body
+
+    @property
+    def sprint(self) -> int | None:
+        return self.issue.sprint
+
+    @property
+    def is_ready(self) -> bool:
+        return self.issue.is_ready
+
+    @property
+    def needs_polish(self) -> bool:
+        return self.issue.needs_polish
+
+    @property
+    def issue_type(self) -> str:
+        return self.issue.issue_type
+
+    @property
+    def size(self) -> str | None:
+        return self.issue.size
 
+    @property
+    def points(self) -> int:
+        return self.issue.points
+
+    @property
+    def priority(self) -> int | None:
+        return self.issue.priority
 
-@dataclass(frozen=True)
+    @property
+    def is_epic_tracking(self) -> bool:
+        return self.issue.is_epic_tracking
+
+    @property
+    def epic(self) -> str | None:
+        return self.issue.epic
+
+
+@dataclass(frozen=True, slots=True)
 class Issue:
     number: int
     title: str
@@ -298,76 +709,50 @@ class Issue:
     updated_at: str
     closed_at: str | None
     body: str = ""
+    # Dependency count when the API reports one in the issue payload (not all
+    # Gitea versions do); None means unknown and the endpoint must be asked.
+    dependency_count: int | None = None
+    # Label-derived fields, computed once; see __post_init__
+    _labels: _LabelInfo = field(init=False, repr=False, compare=False)
+    # Size (S/M/L/XL) from a size/ label, falling back to the body's Effort
+    # section, and its point value. Computed once; see __post_init__
+    size: str | None = field(init=False, repr=False, compare=False)
+    points: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        labels = _classify_labels(self.labels)
+        object.__setattr__(self, "_labels", labels)
+        # Labels first (new convention), then ## Effort: S/M/L/XL or
+        # **Effort:** S in the body
+        size = labels.size
+        if size is None and self.body:
+            size = _parse_effort(self.body)
+        object.__setattr__(self, "size", size)
+        object.__setattr__(self, "points", SIZE_POINTS.get(size or "", 0))
 
     @property
     def sprint(self) -> int | None:
         """Extract sprint number from labels."""
-        for label in self.labels:
-            if match := re.match(r"sprint/(\d+)", label):
-                return int(match.group(1))
-        return None
+        return self._labels.sprint
 
     @property
     def is_ready(self) -> bool:
-        return "ready" in self.labels
+        return self._labels.is_ready
 
     @property
     def needs_polish(self) -> bool:
         """True if issue has needs-polish label."""
-        return "needs-polish" in self.labels
+        return self._labels.needs_polish
 
     @property
     def issue_type(self) -> str:
         """Infer issue type from labels."""
-        for label in self.labels:
-            if label in (
-                "bug",
-                "feature",
-                "tech-debt",
-                "chore",
-                "docs",
-                "hotfix",
-                "epic",
-            ):
-                return label
-        return "unknown"
-
-    @property
-    def size(self) -> str | None:
-        """Extract size from labels or body.
-
-        Checks labels first (size/S, size/M, size/L), then falls back
-        to parsing ## Effort section in body.
-        """
-        # Check labels first (new convention)
-        for label in self.labels:
-            if label.startswith("size/"):
-                return label.split("/")[1].upper()
-
-        # Fallback: parse from body (## Effort: S/M/L/XL or **Effort:** S)
-        # Match "## Effort: S" or "## Effort\nS" or "**Effort:** M" or "XL"
-        if self.body and (
-            match := re.search(
-                r"(?:##\s*Effort[:\s]*|\*\*Effort:?\*\*[:\s]*)(XL|[SMLsml])\b",
-                self.body,
-                re.IGNORECASE,
-            )
-        ):
-            return match.group(1).upper()
-        return None
-
-    @property
-    def points(self) -> int:
-        """Get point value based on size."""
-        return SIZE_POINTS.get(self.size or "", 0)
+        return self._labels.issue_type
 
     @property
     def priority(self) -> int | None:
         """Extract priority from labels (P1=highest, P3=lowest)."""
-        for label in self.labels:
-            if match := re.match(r"P([1-3])$", label):
-                return int(match.group(1))
-        return None
+        return self._labels.priority
 
     @property
     def is_epic_tracking(self) -> bool:
@@ -377,30 +762,74 @@ class Issue:
         issue per epic (alongside the 'epic/name' label). Work items only
         carry 'epic/name', never the bare 'epic' label.
         """
-        return "epic" in self.labels
+        return self._labels.is_epic_tracking
 
     @property
     def epic(self) -> str | None:
         """Extract epic name from labels."""
-        for label in self.labels:
-            if label.startswith("epic/"):
-                return label.split("/", 1)[1]
-        return None
+        return self._labels.epic
+
+
+def _parse_issue(item: dict) -> Issue:
+    """Project a Gitea issue payload onto an Issue.
+
+    Only the fields the dashboard uses are read; everything else in the
+    payload (user, assignees, milestone, ...) is dropped here.
+    """
+    return Issue(
+        number=item["number"],
+        title=item["title"],
+        state=item["state"],
+        # Interned: the same few label names repeat across every issue, and
+        # shared tuples of identical strings also make label-set lookups in
+        # _classify_labels' cache compare by identity
+        labels=tuple(sys.intern(lbl["name"]) for lbl in item.get("labels") or ()),
+        created_at=item["created_at"],
+        updated_at=item["updated_at"],
+        closed_at=item.get("closed_at"),
+        body=item.get("body", ""),
+        dependency_count=item.get("dependencies_count"),
+    )
+
+
+class _SprintStats(NamedTuple):
+    open_count: int
+    closed_count: int
+    total_points: int
+    completed_points: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Sprint:
     number: int
     issues: tuple[Issue, ...]
     lifecycle_state: str = "unknown"  # "in_progress", "planned", "completed", "unknown"
+    # Counts and points aggregated in one pass; see __post_init__
+    _stats: _SprintStats = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        open_count = closed_count = total_points = completed_points = 0
+        for issue in self.issues:
+            points = issue.points
+            total_points += points
+            if issue.state == "open":
+                open_count += 1
+            elif issue.state == "closed":
+                closed_count += 1
+                completed_points += points
+        object.__setattr__(
+            self,
+            "_stats",
+            _SprintStats(open_count, closed_count, total_points, completed_points),
+        )
 
     @property
     def open_count(self) -> int:
-        return sum(1 for i in self.issues if i.state == "open")
+        return self._stats.open_count
 
     @property
     def closed_count(self) -> int:
-        return sum(1 for i in self.issues if i.state == "closed")
+        return self._stats.closed_count
 
     @property
     def total(self) -> int:
@@ -414,11 +843,11 @@ class Sprint:
 
     @property
     def total_points(self) -> int:
-        return sum(i.points for i in self.issues)
+        return self._stats.total_points
 
     @property
     def completed_points(self) -> int:
-        return sum(i.points for i in self.issues if i.state == "closed")
+        return self._stats.completed_points
 
     @property
     def lifecycle_indicator(self) -> str:
@@ -447,7 +876,7 @@ def _parse_start_date(description: str | None) -> date | None:
     return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Milestone:
     """Gitea milestone for sprint lifecycle tracking."""
 
@@ -458,18 +887,18 @@ class Milestone:
     closed_issues: int
     created_at: str
     description: str = ""
-
-    @property
-    def sprint_number(self) -> int | None:
-        """Extract sprint number from title like 'Sprint 45'."""
-        if match := re.match(r"Sprint (\d+)", self.title):
-            return int(match.group(1))
-        return None
-
-    @property
-    def start_date(self) -> date | None:
-        """Get start_date from description (per ADR-0017)."""
-        return _parse_start_date(self.description)
+    # Parsed once from title/description; see __post_init__
+    sprint_number: int | None = field(init=False, repr=False, compare=False)
+    start_date: date | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Sprint number from a title like 'Sprint 45'
+        match = _MILESTONE_SPRINT_RE.match(self.title)
+        object.__setattr__(
+            self, "sprint_number", int(match.group(1)) if match else None
+        )
+        # start_date from description (per ADR-0017)
+        object.__setattr__(self, "start_date", _parse_start_date(self.description))
 
     @property
     def lifecycle_state(self) -> str:
@@ -487,7 +916,30 @@ class Milestone:
         return "planned"
 
 
-@dataclass(frozen=True)
+def _current_sprint_number(milestones: list[Milestone]) -> int | None:
+    """Pick the current sprint from open milestones.
+
+    Returns the lowest in-progress sprint, else the lowest planned sprint,
+    else None (caller falls back to label-based detection).
+    """
+    best_in_progress: int | None = None
+    best_planned: int | None = None
+    for m in milestones:
+        number = m.sprint_number
+        if not number:
+            continue
+        state = m.lifecycle_state
+        if state == "in_progress":
+            if best_in_progress is None or number < best_in_progress:
+                best_in_progress = number
+        elif state == "planned" and (best_planned is None or number < best_planned):
+            best_planned = number
+
+    # No milestones = None, fallback to label-based
+    return best_in_progress if best_in_progress is not None else best_planned
+
+
+@dataclass(frozen=True, slots=True)
 class CIHealth:
     """CI pipeline health for a commit."""
 
@@ -578,7 +1030,7 @@ class CIHealth:
         ]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NightlyHealth:
     """Status of the most recent run for a single nightly workflow."""
 
@@ -660,7 +1112,7 @@ class NightlyHealth:
         return self.status != "not_run"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class NightlySummary:
     """Composite status across all nightly workflows."""
 
@@ -742,7 +1194,7 @@ class NightlySummary:
         return len(self.known_workflows) > 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EpicSummary:
     """Summary of an epic's progress across sprints."""
 
@@ -780,7 +1232,7 @@ def _parse_closed_date(closed_at: str | None) -> date | None:
         return None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BurndownPoint:
     """A single day's data point on the burndown chart."""
 
@@ -791,7 +1243,7 @@ class BurndownPoint:
     ideal_points: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BurndownData:
     """Burndown chart data for a sprint."""
 
@@ -813,28 +1265,34 @@ class BacklogStats:
     def total_count(self) -> int:
         return len(self.issues)
 
+    @cached_property
+    def _tally(self) -> tuple[int, dict[str, int], dict[str | None, list[Issue]]]:
+        """Points total, size counts and epic groups, gathered in one pass."""
+        total_points = 0
+        # Counter so an unexpected size label (size/xxl) still gets counted
+        counts: Counter[str] = Counter({"S": 0, "M": 0, "L": 0, "XL": 0, "?": 0})
+        groups: defaultdict[str | None, list[Issue]] = defaultdict(list)
+        for issue in self.issues:
+            total_points += issue.points
+            counts[issue.size or "?"] += 1
+            groups[issue.epic].append(issue)
+        return total_points, counts, dict(groups)
+
     @property
     def total_points(self) -> int:
-        return sum(i.points for i in self.issues)
+        return self._tally[0]
 
     @property
     def size_counts(self) -> dict[str, int]:
         """Count of issues by size."""
-        counts: dict[str, int] = {"S": 0, "M": 0, "L": 0, "XL": 0, "?": 0}
-        for issue in self.issues:
-            size = issue.size or "?"
-            counts[size] = counts.get(size, 0) + 1
-        return counts
+        return self._tally[1]
 
     @property
     def by_epic(self) -> dict[str | None, list[Issue]]:
         """Group issues by epic."""
-        groups: dict[str | None, list[Issue]] = {}
-        for issue in self.issues:
-            groups.setdefault(issue.epic, []).append(issue)
-        return groups
+        return self._tally[2]
 
-    @property
+    @cached_property
     def epics_sorted(self) -> list[tuple[str | None, list[Issue]]]:
         """Epics sorted by issue count, with None (no epic) last."""
         by_epic = self.by_epic
@@ -855,32 +1313,129 @@ class BoardData:
     sprints: list[Sprint]
     current_sprint_num: int | None
 
-    @property
+    @cached_property
+    def _by_num(self) -> dict[int, Sprint]:
+        """Sprint lookup by number, built on first use."""
+        return {s.number: s for s in self.sprints}
+
+    @cached_property
     def current_sprint(self) -> Sprint | None:
         """Get current (highest numbered) sprint."""
-        for s in self.sprints:
-            if s.number == self.current_sprint_num:
-                return s
+        if self.current_sprint_num is not None:
+            sprint = self._by_num.get(self.current_sprint_num)
+            if sprint is not None:
+                return sprint
         return self.sprints[0] if self.sprints else None
 
     def get_sprint(self, number: int) -> Sprint | None:
         """Get sprint by number."""
-        for s in self.sprints:
-            if s.number == number:
-                return s
-        return None
+        return self._by_num.get(number)
 
-    @property
+    @cached_property
     def next_sprints(self) -> list[Sprint]:
         """Get sprints after current (for planning columns)."""
         if not self.current_sprint_num:
             return []
         return [s for s in self.sprints if s.number > self.current_sprint_num]
 
+    @cached_property
+    def filter_options(self) -> tuple[tuple[str, ...], tuple[str, ...]]:
+        """Sorted (issue types, epics) across backlog and sprints, for filters.
+
+        Frozen as tuples: the value lives on memoised board data and is
+        shared by every request until the next build.
+        """
+        types: set[str] = set()
+        epics: set[str] = set()
+        issues = chain(
+            self.backlog, chain.from_iterable(s.issues for s in self.sprints)
+        )
+        for issue in issues:
+            if issue.issue_type != "unknown":
+                types.add(issue.issue_type)
+            if issue.epic:
+                epics.add(issue.epic)
+        return tuple(sorted(types)), tuple(sorted(epics))
+
 
 # --- Gitea Client ---
 
 
+# (API URL, token, TLS verify setting) identifying a shareable httpx.Client
+_HTTPClientKey = tuple[str, str, bool | str]
+
+
+@dataclass(slots=True)
+class _SharedHTTPClient:
+    client: httpx.Client
+    refs: int = 0
+
+
+# One httpx.Client per Gitea instance and token, shared by every GiteaClient
+# using them (one per repo in get_client's cache, plus the base client), so
+# they all reuse the same TLS connections and HTTP/2 sessions
+_http_clients: dict[_HTTPClientKey, _SharedHTTPClient] = {}
+_http_clients_lock = threading.Lock()
+
+
+def _new_http_client(api_url: str, token: str, verify: bool | str) -> httpx.Client:
+    # Note: Using sync httpx.Client for simplicity. For a read-only dashboard
+    # with low concurrency this is acceptable. For high-load scenarios,
+    # consider switching to httpx.AsyncClient with async methods.
+    #
+    # HTTP/2 (negotiated via ALPN on https) lets the concurrent dependency
+    # fetches share one TLS connection. The transport owns pooling, TLS and
+    # retries, so those settings go on it rather than on the client.
+    return httpx.Client(
+        base_url=api_url,
+        headers={
+            "Authorization": f"token {token}",
+            "Accept": "application/json",
+        },
+        timeout=httpx.Timeout(30.0, connect=5.0),
+        transport=httpx.HTTPTransport(
+            http2=True,
+            verify=verify,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=60.0,
+            ),
+            retries=2,
+        ),
+    )
+
+
+def _acquire_http_client(
+    api_url: str, token: str
+) -> tuple[_HTTPClientKey, httpx.Client]:
+    """Take a reference to the shared httpx.Client for an instance and token."""
+    key = (api_url, token, _get_ssl_verify())
+    with _http_clients_lock:
+        shared = _http_clients.get(key)
+        if shared is None or shared.client.is_closed:
+            shared = _http_clients[key] = _SharedHTTPClient(_new_http_client(*key))
+        shared.refs += 1
+        return key, shared.client
+
+
+def _release_http_client(key: _HTTPClientKey, client: httpx.Client) -> bool:
+    """Drop a reference taken by _acquire_http_client.
+
+    The shared client is closed with its last reference. Returns False if
+    client isn't the one currently shared under key, leaving it to the caller.
+    """
+    with _http_clients_lock:
+        shared = _http_clients.get(key)
+        if shared is None or shared.client is not client:
+            return False
+        shared.refs -= 1
+        if shared.refs <= 0:
+            del _http_clients[key]
+            client.close()
+        return True
+
+
 class GiteaClient:
     """Simple Gitea API client.
 
@@ -909,15 +1464,16 @@ class GiteaClient:
             tea_login: Specific tea login name to use (optional)
             skip_repo_env: If True, don't fall back to env for owner/repo (for base client)
         """
-        # Try tea config as fallback for URL and token
-        tea = _get_tea_login(tea_login)
-
-        self.base_url = (
-            base_url or os.getenv("GITEA_URL") or (tea.get("url") if tea else None)
-        )
-        self.token = (
-            token or os.getenv("GITEA_TOKEN") or (tea.get("token") if tea else None)
-        )
+        self.base_url = base_url or os.getenv("GITEA_URL")
+        self.token = token or os.getenv("GITEA_TOKEN")
+
+        # Try tea config as fallback for URL and token; skip the disk read
+        # entirely when both are already configured (the container case).
+        if not (self.base_url and self.token):
+            tea = _get_tea_login(tea_login)
+            if tea:
+                self.base_url = self.base_url or tea.get("url")
+                self.token = self.token or tea.get("token")
         if skip_repo_env:
             self.owner = owner if owner is not None else ""
             self.repo = repo if repo is not None else ""
@@ -939,22 +1495,17 @@ class GiteaClient:
         # Normalize URL
         api_url = _normalize_base_url(self.base_url)
 
-        # Note: Using sync httpx.Client for simplicity. For a read-only dashboard
-        # with low concurrency this is acceptable. For high-load scenarios,
-        # consider switching to httpx.AsyncClient with async methods.
-        self._client = httpx.Client(
-            base_url=api_url,
-            headers={
-                "Authorization": f"token {self.token}",
-                "Accept": "application/json",
-            },
-            timeout=30.0,
-            verify=_get_ssl_verify(),
-        )
+        # Clients for the same instance and token share one httpx.Client (and
+        # so one connection pool); see _acquire_http_client
+        self._http_key: _HTTPClientKey | None
+        self._http_key, self._client = _acquire_http_client(api_url, self.token)
 
     def close(self) -> None:
-        """Close the HTTP client."""
-        self._client.close()
+        """Release the HTTP client, closing it once no other client shares it."""
+        key, self._http_key = self._http_key, None
+        if key is not None and not _release_http_client(key, self._client):
+            # Not the shared client (replaced after construction): ours to close
+            self._client.close()
 
     def __enter__(self) -> "GiteaClient":
         return self
@@ -981,68 +1532,154 @@ class GiteaClient:
         # Include base_url in cache key for multi-instance support
         cache_key = (self.base_url, self.owner, self.repo, state, labels)
 
-        # Check cache first
-        if cache_key in _issues_cache:
-            return _issues_cache[cache_key]
+        # Check cache first, then join any fetch already under way
+        with _issues_lock:
+            cached = _issues_cache.get(cache_key)
+            if cached is not None:
+                return cached
+            inflight = _issues_inflight.get(cache_key)
+            if inflight is None:
+                future: Future[list[Issue]] = Future()
+                _issues_inflight[cache_key] = future
+        if inflight is not None:
+            return inflight.result()
 
-        params: dict[str, str | int] = {"state": state, "limit": PAGE_LIMIT}
+        try:
+            issues = self._fetch_issues(cache_key, state, labels, max_pages)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(issues)
+            return issues
+        finally:
+            with _issues_lock:
+                del _issues_inflight[cache_key]
+
+    def _fetch_issues(
+        self,
+        cache_key: tuple[str | None, str | None, str | None, str, str | None],
+        state: str,
+        labels: str | None,
+        max_pages: int,
+    ) -> list[Issue]:
+        """Page through the issue listing and refresh the issue caches."""
+        # type=issues: the endpoint otherwise mixes pull requests into the
+        # listing, which the dashboard would download only to misfile
+        params: dict[str, str | int] = {
+            "state": state,
+            "type": "issues",
+            "limit": PAGE_LIMIT,
+        }
         if labels:
             params["labels"] = labels
 
-        issues: list[Issue] = []
-        page = 1
         truncated = False
+        url = f"/repos/{self.owner}/{self.repo}/issues"
+        # Pages from the last full fetch, kept past the TTL for revalidation;
+        # after a restart they may still be on disk
+        with _issues_lock:
+            stale = _issues_etag_cache.get(cache_key)
+        store = _issue_page_store
+        store_key = orjson.dumps(cache_key).decode() if store else ""
+        if stale is None and store is not None:
+            stored = store.load(store_key)
+            if stored is not None:
+                stale = (stored, [issue for page in stored for issue in page.issues])
+        # Raw bodies of pages downloaded (not 304'd) this time, for the store
+        fresh: dict[int, tuple[str, str, bytes]] = {}
+
+        def fetch_page(n: int, cached: _IssuePage | None = None) -> _IssuePage:
+            headers = {"If-None-Match": cached.etag} if cached and cached.etag else None
+            resp = self._client.get(url, params={**params, "page": n}, headers=headers)
+            if cached is not None and resp.status_code == 304:
+                return cached
+            resp.raise_for_status()
+            data = orjson.loads(resp.content)
+            page = _IssuePage(
+                etag=resp.headers.get("etag"),
+                issues=[_parse_issue(item) for item in data],
+                total=resp.headers.get("x-total-count", ""),
+            )
+            if store is not None and page.etag:
+                fresh[n] = (page.etag, page.total, resp.content)
+            return page
 
         try:
-            while page <= max_pages:
-                params["page"] = page
-                resp = self._client.get(
-                    f"/repos/{self.owner}/{self.repo}/issues",
-                    params=params,
+            if stale is not None and stale[0][0].etag:
+                # Revalidate every known page at once; unchanged pages come
+                # back as bodiless 304s and are reused as-is
+                pages = list(
+                    _page_pool.map(fetch_page, range(1, len(stale[0]) + 1), stale[0])
                 )
-                resp.raise_for_status()
-                data = resp.json()
-
-                if not data:
+            else:
+                # Page 1 tells us the total (X-Total-Count); the remaining pages
+                # are then requested concurrently instead of one after another
+                pages = [fetch_page(1)]
+                total = pages[0].total
+                if len(pages[0].issues) == PAGE_LIMIT and total.isdigit():
+                    last_page = max(-(-int(total) // PAGE_LIMIT), 1)
+                    stop = min(last_page, max_pages)
+                    pages.extend(_page_pool.map(fetch_page, range(2, stop + 1)))
+                    truncated = last_page > max_pages
+
+            # Anything after a short page is stale (issues closed or moved)
+            for i, page in enumerate(pages):
+                if len(page.issues) < PAGE_LIMIT:
+                    del pages[i + 1 :]
                     break
 
-                for item in data:
-                    issues.append(
-                        Issue(
-                            number=item["number"],
-                            title=item["title"],
-                            state=item["state"],
-                            labels=tuple(lbl["name"] for lbl in item.get("labels", [])),
-                            created_at=item["created_at"],
-                            updated_at=item["updated_at"],
-                            closed_at=item.get("closed_at"),
-                            body=item.get("body", ""),
-                        )
-                    )
-
-                # If we got fewer items than the limit, we're on the last page
-                if len(data) < PAGE_LIMIT:
+            # Without X-Total-Count, page sequentially until a short page. With
+            # it, a full last page is only followed when the total says more
+            # exist, saving the empty request when total % PAGE_LIMIT == 0
+            total = pages[0].total
+            while (
+                not truncated
+                and len(pages[-1].issues) == PAGE_LIMIT
+                and (not total.isdigit() or int(total) > len(pages) * PAGE_LIMIT)
+            ):
+                if len(pages) >= max_pages:
+                    # Hit max_pages ceiling
+                    truncated = True
                     break
-                page += 1
-            else:
-                # Loop completed without break - hit max_pages ceiling
-                truncated = True
+                page = fetch_page(len(pages) + 1)
+                if not page.issues:
+                    break
+                pages.append(page)
 
         except httpx.HTTPStatusError as e:
             raise GiteaError(f"Gitea API error: {e.response.status_code}") from e
         except httpx.RequestError as e:
             raise GiteaError(f"Network error: {e}") from e
 
+        if (
+            stale is not None
+            and len(pages) == len(stale[0])
+            and all(page is old for page, old in zip(pages, stale[0], strict=True))
+        ):
+            # Nothing changed: keep the existing list (and its identity)
+            issues = stale[1]
+        else:
+            issues = [issue for page in pages for issue in page.issues]
+        if pages[0].etag:
+            with _issues_lock:
+                _issues_etag_cache[cache_key] = (tuple(pages), issues)
+            if store is not None and (
+                fresh or len(pages) != len(stale[0] if stale else ())
+            ):
+                store.save(store_key, len(pages), fresh)
+
         if truncated:
             warnings.warn(
                 f"Issues list truncated at {max_pages} pages "
                 f"({len(issues)} items). Results may be incomplete.",
                 UserWarning,
-                stacklevel=2,
+                stacklevel=3,
             )
 
         # Cache the result
-        _issues_cache[cache_key] = issues
+        with _issues_lock:
+            _issues_cache[cache_key] = issues
         return issues
 
     def get_sprint(self, number: int) -> Sprint:
@@ -1126,129 +1763,125 @@ class GiteaClient:
         query = query.strip()
 
         # Check if query is an issue number (with or without #)
-        number_match = re.match(r"^#?(\d+)$", query)
+        number_match = _ISSUE_NUMBER_QUERY_RE.fullmatch(query)
         if number_match:
             target_num = int(number_match.group(1))
             return [i for i in all_issues if i.number == target_num]
 
         # Otherwise search by title
-        query_lower = query.lower()
-        return [i for i in all_issues if query_lower in i.title.lower()]
+        return filter_by_title(all_issues, query)
 
-    def get_issue(self, number: int) -> Issue:
-        """Get a single issue by number."""
+    def _get_json(self, path: str, *, missing_ok: bool = False) -> Any:
+        """GET a repo-relative API path and decode the JSON body.
+
+        Args:
+            path: Path under /repos/{owner}/{repo}/
+            missing_ok: Return None on 404 instead of raising
+
+        Raises:
+            GiteaError: On HTTP or network errors
+        """
         try:
-            resp = self._client.get(f"/repos/{self.owner}/{self.repo}/issues/{number}")
+            resp = self._client.get(f"/repos/{self.owner}/{self.repo}/{path}")
             resp.raise_for_status()
-            item = resp.json()
-            return Issue(
-                number=item["number"],
-                title=item["title"],
-                state=item["state"],
-                labels=tuple(lbl["name"] for lbl in item.get("labels", [])),
-                created_at=item["created_at"],
-                updated_at=item["updated_at"],
-                closed_at=item.get("closed_at"),
-                body=item.get("body", ""),
-            )
+            return orjson.loads(resp.content)
         except httpx.HTTPStatusError as e:
+            if missing_ok and e.response.status_code == 404:
+                return None
             raise GiteaError(f"Gitea API error: {e.response.status_code}") from e
         except httpx.RequestError as e:
             raise GiteaError(f"Network error: {e}") from e
 
+    def get_issue(self, number: int) -> Issue:
+        """Get a single issue by number."""
+        return _parse_issue(self._get_json(f"issues/{number}"))
+
     def get_issue_comments(self, number: int) -> list[Comment]:
         """Get comments for an issue."""
-        try:
-            resp = self._client.get(
-                f"/repos/{self.owner}/{self.repo}/issues/{number}/comments"
+        return [
+            Comment(
+                id=item["id"],
+                body=item["body"],
+                user=item.get("user", {}).get("login", "unknown"),
+                created_at=item["created_at"],
+                updated_at=item["updated_at"],
             )
-            resp.raise_for_status()
-            data = resp.json()
-            return [
-                Comment(
-                    id=item["id"],
-                    body=item["body"],
-                    user=item.get("user", {}).get("login", "unknown"),
-                    created_at=item["created_at"],
-                    updated_at=item["updated_at"],
-                )
-                for item in data
-            ]
-        except httpx.HTTPStatusError as e:
-            raise GiteaError(f"Gitea API error: {e.response.status_code}") from e
-        except httpx.RequestError as e:
-            raise GiteaError(f"Network error: {e}") from e
+            for item in self._get_json(f"issues/{number}/comments")
+        ]
 
     def _parse_dependency(self, item: dict) -> Dependency:
         """Parse a dependency from API response."""
-        labels = [lbl["name"] for lbl in item.get("labels", [])]
-        sprint_num = None
-        for label in labels:
-            if match := re.match(r"sprint/(\d+)", label):
-                sprint_num = int(match.group(1))
-                break
         return Dependency(
             number=item["number"],
             title=item["title"],
             state=item["state"],
-            sprint=sprint_num,
+            sprint=_sprint_from_labels(lbl["name"] for lbl in item.get("labels") or ()),
         )
 
     def get_issue_dependencies(self, number: int) -> list[Dependency]:
         """Get issues that this issue depends on (is blocked by)."""
-        try:
-            resp = self._client.get(
-                f"/repos/{self.owner}/{self.repo}/issues/{number}/dependencies"
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            return [self._parse_dependency(item) for item in data] if data else []
-        except httpx.HTTPStatusError as e:
-            # 404 might mean dependencies feature not enabled or no deps
-            if e.response.status_code == 404:
-                return []
-            raise GiteaError(f"Gitea API error: {e.response.status_code}") from e
-        except httpx.RequestError as e:
-            raise GiteaError(f"Network error: {e}") from e
+        # 404 might mean dependencies feature not enabled or no deps
+        data = self._get_json(f"issues/{number}/dependencies", missing_ok=True)
+        return [self._parse_dependency(item) for item in data] if data else []
 
     def get_issue_blocks(self, number: int) -> list[Dependency]:
         """Get issues that this issue blocks."""
-        try:
-            resp = self._client.get(
-                f"/repos/{self.owner}/{self.repo}/issues/{number}/blocks"
-            )
-            resp.raise_for_status()
-            data = resp.json()
-            return [self._parse_dependency(item) for item in data] if data else []
-        except httpx.HTTPStatusError as e:
-            # 404 might mean dependencies feature not enabled or no blocks
-            if e.response.status_code == 404:
-                return []
-            raise GiteaError(f"Gitea API error: {e.response.status_code}") from e
-        except httpx.RequestError as e:
-            raise GiteaError(f"Network error: {e}") from e
+        # 404 might mean dependencies feature not enabled or no blocks
+        data = self._get_json(f"issues/{number}/blocks", missing_ok=True)
+        return [self._parse_dependency(item) for item in data] if data else []
+
+    def _deps_cache_key(self, number: int) -> str:
+        return f"{self.base_url}:{self.owner}/{self.repo}:{number}"
 
     def get_dependency_info(
-        self, number: int
+        self,
+        number: int,
+        *,
+        fetch_blocks: bool = True,
+        fetch_dependencies: bool = True,
     ) -> tuple[int, int, list[tuple[int, str, int | None]]]:
         """Get cached dependency counts and blocker info for an issue.
 
+        The dependencies and blocks endpoints are requested concurrently.
+        Pass ``fetch_blocks=False`` to skip the blocks round-trip when
+        ``blocks_count`` isn't displayed; it is then reported as 0 unless a
+        full result is already cached. Pass ``fetch_dependencies=False``
+        when the issue payload already reported no dependencies.
+
         Returns:
             Tuple of (blocked_by_count, blocks_count, blockers_list)
             where blockers_list is [(issue_num, state, sprint_num), ...]
         """
-        cache_key = f"{self.base_url}:{self.owner}/{self.repo}:{number}"
-        if cache_key in _deps_cache:
-            return _deps_cache[cache_key]
+        cache_key = self._deps_cache_key(number)
+        with _cache_lock:
+            cached = _deps_cache.get(cache_key)
+        if cached is not None and time.monotonic() - cached[0] < DEPS_TTL:
+            return cached[1]
+
+        if not fetch_blocks and not fetch_dependencies:
+            return (0, 0, [])
 
         try:
-            deps = self.get_issue_dependencies(number)
-            blocks = self.get_issue_blocks(number)
+            if not fetch_blocks:
+                deps = self.get_issue_dependencies(number)
+                return (len(deps), 0, [(d.number, d.state, d.sprint) for d in deps])
+
+            if fetch_dependencies:
+                blocks_future = _fetch_pool.submit(self.get_issue_blocks, number)
+                try:
+                    deps = self.get_issue_dependencies(number)
+                finally:
+                    # Always collect the future so its error (if any) isn't lost
+                    blocks = blocks_future.result()
+            else:
+                deps = []
+                blocks = self.get_issue_blocks(number)
 
             blockers = [(d.number, d.state, d.sprint) for d in deps]
             result = (len(deps), len(blocks), blockers)
 
-            _deps_cache[cache_key] = result
+            with _cache_lock:
+                _deps_cache[cache_key] = (time.monotonic(), result)
             return result
         except GiteaError as e:
             # Log error but return empty deps to avoid breaking the board
@@ -1258,7 +1891,9 @@ class GiteaClient:
     def to_board_issue(self, issue: Issue, fetch_deps: bool = True) -> BoardIssue:
         """Convert an Issue to a BoardIssue with dependency info."""
         if fetch_deps:
-            blocked_by, blocks, blockers = self.get_dependency_info(issue.number)
+            blocked_by, blocks, blockers = self.get_dependency_info(
+                issue.number, fetch_dependencies=issue.dependency_count != 0
+            )
             return BoardIssue(
                 issue=issue,
                 blocked_by_count=blocked_by,
@@ -1271,8 +1906,46 @@ class GiteaClient:
         self, issues: list[Issue], fetch_deps: bool = True
     ) -> list[BoardIssue]:
         """Convert a list of Issues to BoardIssues."""
+        if fetch_deps:
+            self._prefetch_dependency_info(issues)
         return [self.to_board_issue(issue, fetch_deps) for issue in issues]
 
+    def _prefetch_dependency_info(self, issues: list[Issue]) -> None:
+        """Warm the dependency cache for issues with concurrent requests.
+
+        Gitea has no batch dependency endpoint, so every uncached issue
+        still costs a dependencies and a blocks request; they are issued
+        together on the shared pool instead of two at a time. Failures are
+        left uncached for get_dependency_info to retry and report.
+        """
+        now = time.monotonic()
+        pending = []
+        for issue in issues:
+            with _cache_lock:
+                cached = _deps_cache.get(self._deps_cache_key(issue.number))
+            if cached is not None and now - cached[0] < DEPS_TTL:
+                continue
+            deps_future = (
+                _fetch_pool.submit(self.get_issue_dependencies, issue.number)
+                if issue.dependency_count != 0
+                else None
+            )
+            blocks_future = _fetch_pool.submit(self.get_issue_blocks, issue.number)
+            pending.append((issue.number, deps_future, blocks_future))
+
+        for number, deps_future, blocks_future in pending:
+            try:
+                deps = deps_future.result() if deps_future is not None else []
+                blocks = blocks_future.result()
+            except GiteaError:
+                continue
+            blockers = [(d.number, d.state, d.sprint) for d in deps]
+            with _cache_lock:
+                _deps_cache[self._deps_cache_key(number)] = (
+                    time.monotonic(),
+                    (len(deps), len(blocks), blockers),
+                )
+
     def get_milestones(self, state: str = "all") -> list[Milestone]:
         """Fetch milestones with caching.
 
@@ -1283,14 +1956,22 @@ class GiteaClient:
             List of milestones matching the filter (only sprint milestones)
         """
         cache_key = f"{self.base_url}:{self.owner}/{self.repo}:milestones:{state}"
-        if cache_key in _milestones_cache:
-            return _milestones_cache[cache_key]
+        with _cache_lock:
+            cached = _milestones_cache.get(cache_key)
+            stale = _milestones_etag_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             resp = self._client.get(
                 f"/repos/{self.owner}/{self.repo}/milestones",
                 params={"state": state},
+                headers={"If-None-Match": stale[0]} if stale else None,
             )
+            if stale is not None and resp.status_code == 304:
+                with _cache_lock:
+                    _milestones_cache[cache_key] = stale[1]
+                return stale[1]
             resp.raise_for_status()
             milestones = [
                 Milestone(
@@ -1302,10 +1983,14 @@ class GiteaClient:
                     created_at=m["created_at"],
                     description=m.get("description", ""),
                 )
-                for m in resp.json()
+                for m in orjson.loads(resp.content)
                 if m["title"].startswith("Sprint ")  # Filter to sprint milestones
             ]
-            _milestones_cache[cache_key] = milestones
+            etag = resp.headers.get("etag")
+            with _cache_lock:
+                _milestones_cache[cache_key] = milestones
+                if etag:
+                    _milestones_etag_cache[cache_key] = (etag, milestones)
             return milestones
         except httpx.HTTPStatusError as e:
             raise GiteaError(f"Gitea API error: {e.response.status_code}") from e
@@ -1319,29 +2004,7 @@ class GiteaClient:
             Sprint number of the current in-progress sprint, or lowest planned
             sprint if none in progress, or None if no milestones exist.
         """
-        milestones = self.get_milestones(state="open")
-
-        # Find in_progress milestones (lowest number first for multiple active)
-        in_progress = [
-            m
-            for m in milestones
-            if m.lifecycle_state == "in_progress" and m.sprint_number
-        ]
-        in_progress.sort(key=lambda m: m.sprint_number or 0)
-
-        if in_progress:
-            return in_progress[0].sprint_number
-
-        # Fallback: lowest planned sprint
-        planned = [
-            m for m in milestones if m.lifecycle_state == "planned" and m.sprint_number
-        ]
-        planned.sort(key=lambda m: m.sprint_number or 0)
-
-        if planned:
-            return planned[0].sprint_number
-
-        return None  # No milestones = fallback to label-based
+        return _current_sprint_number(self.get_milestones(state="open"))
 
     def get_user_repos(self) -> list[dict[str, str]]:
         """Fetch repositories accessible to the authenticated user.
@@ -1353,8 +2016,10 @@ class GiteaClient:
             Returns empty list on error.
         """
         cache_key = f"{self.base_url}:user_repos"
-        if cache_key in _user_repos_cache:
-            return _user_repos_cache[cache_key]
+        with _cache_lock:
+            cached = _user_repos_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         try:
             repos: list[dict[str, str]] = []
@@ -1365,7 +2030,7 @@ class GiteaClient:
                     "/user/repos", params={"limit": PAGE_LIMIT, "page": page}
                 )
                 resp.raise_for_status()
-                data = resp.json()
+                data = orjson.loads(resp.content)
 
                 if not data:
                     break
@@ -1391,7 +2056,8 @@ class GiteaClient:
                 )
 
             repos = sorted(repos, key=lambda x: x["full_name"].lower())
-            _user_repos_cache[cache_key] = repos
+            with _cache_lock:
+                _user_repos_cache[cache_key] = repos
             return repos
         except (httpx.HTTPStatusError, httpx.RequestError) as e:
             logger.warning(f"Failed to fetch user repos: {e}")
@@ -1619,6 +2285,7 @@ class GiteaClient:
 # Client cache for proper lifecycle management
 # Key: (base_url, owner, repo) to support multi-instance scenarios
 _client_cache: dict[tuple[str | None, str | None, str | None], GiteaClient] = {}
+_client_cache_lock = threading.Lock()
 
 
 def _get_base_url() -> str | None:
@@ -1643,17 +2310,25 @@ def get_client(owner: str | None = None, repo: str | None = None) -> GiteaClient
     # Include base_url in cache key to support multiple Gitea instances
     base_url = _get_base_url()
     key = (base_url, owner, repo)
-    if key not in _client_cache:
-        _client_cache[key] = GiteaClient(owner=owner, repo=repo)
-    return _client_cache[key]
+    client = _client_cache.get(key)
+    if client is not None:
+        return client
+    # Slow path: build under the lock so concurrent first requests for a
+    # repo don't each construct (and leak) a client
+    with _client_cache_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            client = _client_cache[key] = GiteaClient(owner=owner, repo=repo)
+    return client
 
 
 def close_all_clients() -> None:
     """Close all cached Gitea clients and clear the cache."""
     global _base_client
-    for client in _client_cache.values():
-        client.close()
-    _client_cache.clear()
+    with _client_cache_lock:
+        for client in _client_cache.values():
+            client.close()
+        _client_cache.clear()
     # Also close the base client
     if _base_client is not None:
         _base_client.close()
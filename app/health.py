@@ -2,6 +2,7 @@
 
 import logging
 import os
+import time
 
 from fastapi import APIRouter
 from fastapi.responses import JSONResponse
@@ -11,13 +12,22 @@ from .database import get_db
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Fixed for the life of the process, so read once rather than per probe
+GIT_SHA = os.getenv("GIT_SHA", "dev")
 
-@router.get("/health")
-async def health() -> JSONResponse:
-    """Return health status and deployed git SHA.
+# Seconds a database probe result is reused. Docker HEALTHCHECK and deploy
+# verification poll every few seconds; there's no need to hit SQLite each time.
+DB_PROBE_TTL = 5.0
+_last_probe: tuple[float, str] | None = None
+
+
+def _probe_db() -> str:
+    """Run (or reuse a recent) database probe; returns 'ok' or 'error'."""
+    global _last_probe
+    now = time.monotonic()
+    if _last_probe is not None and now - _last_probe[0] < DB_PROBE_TTL:
+        return _last_probe[1]
 
-    Returns 200 when healthy, 503 when database is unavailable.
-    """
     db_status = "ok"
     try:
         conn = get_db()
@@ -25,13 +35,24 @@ async def health() -> JSONResponse:
     except Exception:
         logger.exception("Database health check failed")
         db_status = "error"
+    _last_probe = (now, db_status)
+    return db_status
+
+
+@router.get("/health")
+async def health() -> JSONResponse:
+    """Return health status and deployed git SHA.
+
+    Returns 200 when healthy, 503 when database is unavailable.
+    """
+    db_status = _probe_db()
 
     overall = "ok" if db_status == "ok" else "degraded"
     status_code = 200 if db_status == "ok" else 503
     return JSONResponse(
         content={
             "status": overall,
-            "git_sha": os.getenv("GIT_SHA", "dev"),
+            "git_sha": GIT_SHA,
             "db": db_status,
         },
         status_code=status_code,
@@ -6,18 +6,30 @@ instance over HTTP instead of accessing SQLite directly.
 
 from __future__ import annotations
 
+import time
 from typing import Any
 
 import httpx
+import orjson
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 
 class SprintDashError(Exception):
     """Error from the sprint-dash API."""
 
-    def __init__(self, message: str, code: str = "", status: int = 0):
+    def __init__(
+        self,
+        message: str,
+        code: str = "",
+        status: int = 0,
+        details: dict | None = None,
+    ):
         super().__init__(message)
         self.code = code
         self.status = status
+        # Full error body, e.g. the partial results of a batch operation
+        self.details = details or {}
 
 
 class SprintDashClient:
@@ -26,10 +38,39 @@ class SprintDashClient:
     Mirrors the SprintStore interface so CLI commands work with either backend.
     """
 
-    def __init__(self, base_url: str, owner: str, repo: str, **kwargs: Any):
+    def __init__(
+        self,
+        base_url: str,
+        owner: str,
+        repo: str,
+        *,
+        max_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        cache_ttl: float = 5.0,
+        **kwargs: Any,
+    ):
         self.base_url = base_url.rstrip("/")
         self.owner = owner
         self.repo = repo
+        # Successful GET responses, reused for cache_ttl seconds and then
+        # revalidated with If-None-Match; dropped on any write since one CLI
+        # command often reads a sprint twice
+        self.cache_ttl = cache_ttl
+        self._cache: dict[tuple[str, tuple], tuple[float, httpx.Response]] = {}
+        # Keep connections alive across calls and negotiate HTTP/2 on https,
+        # so CLI loops reuse one TLS session. A caller-supplied transport
+        # (e.g. tests) is used as-is.
+        if "transport" not in kwargs:
+            kwargs["transport"] = httpx.HTTPTransport(
+                http2=True,
+                verify=kwargs.pop("verify", True),
+                limits=httpx.Limits(
+                    max_connections=max_connections,
+                    max_keepalive_connections=max_connections,
+                    keepalive_expiry=keepalive_expiry,
+                ),
+                retries=2,
+            )
         self._client = httpx.Client(
             base_url=f"{self.base_url}/{owner}/{repo}/api/v1",
             timeout=30.0,
@@ -49,33 +90,68 @@ class SprintDashClient:
         Wraps httpx transport errors (connection refused, timeout, DNS failure)
         as SprintDashError so callers only need to catch one exception type.
         """
+        headers = None
+        cached = None
+        if method == "GET":
+            cache_key = (path, tuple(sorted((params or {}).items())))
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                if time.monotonic() - cached[0] < self.cache_ttl:
+                    return cached[1]
+                etag = cached[1].headers.get("ETag")
+                if etag:
+                    headers = {"If-None-Match": etag}
+        else:
+            self._cache.clear()
+
+        # Bodies are encoded with orjson rather than httpx's stdlib json
+        content = orjson.dumps(json) if json is not None else None
+        if content is not None:
+            headers = _JSON_HEADERS
         try:
-            resp = self._client.request(method, path, json=json, params=params)
+            resp = self._client.request(
+                method, path, content=content, headers=headers, params=params
+            )
         except httpx.RequestError as exc:
             raise SprintDashError(
                 f"Connection error: {exc}", code="connection_error", status=0
             ) from exc
+        if resp.status_code == 304 and cached is not None:
+            self._cache[cache_key] = (time.monotonic(), cached[1])
+            return cached[1]
         if resp.status_code == 204:
             return resp
         if resp.status_code >= 400:
             try:
-                body = resp.json()
+                body = orjson.loads(resp.content)
                 msg = body.get("error", resp.text)
                 code = body.get("code", "")
             except Exception:
+                body = None
                 msg = resp.text
                 code = ""
-            raise SprintDashError(msg, code=code, status=resp.status_code)
+            raise SprintDashError(
+                msg,
+                code=code,
+                status=resp.status_code,
+                details=body if isinstance(body, dict) else None,
+            )
+        if method == "GET" and (self.cache_ttl > 0 or "ETag" in resp.headers):
+            self._cache[cache_key] = (time.monotonic(), resp)
         return resp
 
     # --- Sprint operations ---
 
-    def list_sprints(self, *, status: str | None = None) -> list[dict]:
-        params = {}
+    def list_sprints(
+        self, *, status: str | None = None, limit: int | None = None
+    ) -> list[dict]:
+        params: dict[str, Any] = {}
         if status:
             params["status"] = status
+        if limit is not None:
+            params["limit"] = limit
         resp = self._request("GET", "/sprints", params=params)
-        result: list[dict] = resp.json()
+        result: list[dict] = orjson.loads(resp.content)
         return result
 
     def get_sprint(self, number: int) -> dict | None:
@@ -85,7 +161,7 @@ class SprintDashClient:
             if e.status == 404:
                 return None
             raise
-        result: dict = resp.json()
+        result: dict = orjson.loads(resp.content)
         return result
 
     def create_sprint(
@@ -103,7 +179,7 @@ class SprintDashClient:
         if end_date:
             body["end_date"] = end_date
         resp = self._request("POST", "/sprints", json=body)
-        result: dict = resp.json()
+        result: dict = orjson.loads(resp.content)
         return result
 
     def update_sprint(self, number: int, **fields: str | None) -> dict | None:
@@ -114,7 +190,7 @@ class SprintDashClient:
             if e.status == 404:
                 return None
             raise
-        result: dict = resp.json()
+        result: dict = orjson.loads(resp.content)
         return result
 
     def start_sprint(self, number: int, *, start_date: str | None = None) -> dict:
@@ -122,7 +198,7 @@ class SprintDashClient:
         if start_date:
             body["start_date"] = start_date
         resp = self._request("POST", f"/sprints/{number}/start", json=body)
-        result: dict = resp.json()
+        result: dict = orjson.loads(resp.content)
         return result
 
     def close_sprint(
@@ -136,12 +212,12 @@ class SprintDashClient:
         if carry_over_to is not None and carry_over_to > 0:
             body["carry_over_to"] = carry_over_to
         resp = self._request("POST", f"/sprints/{number}/close", json=body)
-        result: dict = resp.json()
+        result: dict = orjson.loads(resp.content)
         return result
 
     def cancel_sprint(self, number: int) -> dict:
         resp = self._request("POST", f"/sprints/{number}/cancel", json={})
-        result: dict = resp.json()
+        result: dict = orjson.loads(resp.content)
         return result
 
     def get_current_sprint_number(self) -> int | None:
@@ -151,7 +227,7 @@ class SprintDashClient:
             if e.status == 404:
                 return None
             raise
-        data: dict = resp.json()
+        data: dict = orjson.loads(resp.content)
         return data.get("number")
 
     # --- Issue operations ---
@@ -163,26 +239,40 @@ class SprintDashClient:
             if e.status == 404:
                 return []
             raise
-        data: dict = resp.json()
+        data: dict = orjson.loads(resp.content)
         issues: list[int] = data["issues"]
         return issues
 
     def add_issue(
         self, sprint_number: int, issue_number: int, *, source: str = "manual"
     ) -> bool:
+        added, _ = self.add_issues(sprint_number, [issue_number], source=source)
+        return bool(added)
+
+    def add_issues(
+        self, sprint_number: int, issue_numbers: list[int], *, source: str = "manual"
+    ) -> tuple[list[int], list[int]]:
+        """Add several issues to a sprint in one request.
+
+        Returns:
+            (added, failed) issue numbers.
+        """
+        if not issue_numbers:
+            return [], []
         try:
-            self._request(
+            resp = self._request(
                 "POST",
                 f"/sprints/{sprint_number}/issues",
-                json={"issues": [issue_number], "source": source},
+                json={"issues": issue_numbers, "source": source},
             )
+            added: list[int] = orjson.loads(resp.content)["added"]
         except SprintDashError as e:
             # Re-raise transport errors and unexpected server errors;
-            # only return False for expected domain failures (400/404/409)
+            # expected domain failures (400/404/409) just fail the issues
             if e.code == "connection_error" or e.status >= 500:
                 raise
-            return False
-        return True
+            added = e.details.get("added", [])
+        return added, [n for n in issue_numbers if n not in added]
 
     def remove_issue(self, sprint_number: int, issue_number: int) -> bool:
         try:
@@ -193,22 +283,74 @@ class SprintDashClient:
             return False
         return True
 
+    def remove_issues(
+        self, sprint_number: int, issue_numbers: list[int]
+    ) -> tuple[list[int], list[int]]:
+        """Remove several issues from a sprint in one request.
+
+        Returns:
+            (removed, failed) issue numbers.
+        """
+        if not issue_numbers:
+            return [], []
+        try:
+            resp = self._request(
+                "POST",
+                f"/sprints/{sprint_number}/issues/remove",
+                json={"issues": issue_numbers},
+            )
+            removed: list[int] = orjson.loads(resp.content)["removed"]
+        except SprintDashError as e:
+            if e.code == "connection_error" or e.status >= 500:
+                raise
+            if not e.code and e.status in (404, 405):
+                # Server predates the batch endpoint: remove one at a time
+                removed = [
+                    n for n in issue_numbers if self.remove_issue(sprint_number, n)
+                ]
+            else:
+                removed = e.details.get("removed", [])
+        return removed, [n for n in issue_numbers if n not in removed]
+
     def move_issue(self, issue_number: int, from_sprint: int, to_sprint: int) -> bool:
+        moved, _ = self.move_issues([issue_number], from_sprint, to_sprint)
+        return bool(moved)
+
+    def move_issues(
+        self, issue_numbers: list[int], from_sprint: int, to_sprint: int
+    ) -> tuple[list[int], list[int]]:
+        """Move several issues between sprints in one request.
+
+        The server refuses the whole batch if any issue isn't in the source
+        sprint; those are reported as failed and the rest retried once, so
+        the result matches moving each issue individually.
+
+        Returns:
+            (moved, failed) issue numbers.
+        """
+        if not issue_numbers:
+            return [], []
         try:
-            self._request(
+            resp = self._request(
                 "POST",
                 "/issues/move",
                 json={
-                    "issues": [issue_number],
+                    "issues": issue_numbers,
                     "from_sprint": from_sprint,
                     "to_sprint": to_sprint,
                 },
             )
+            moved: list[int] = orjson.loads(resp.content)["moved"]
         except SprintDashError as e:
             if e.code == "connection_error" or e.status >= 500:
                 raise
-            return False
-        return True
+            missing = e.details.get("missing")
+            if missing:
+                rest = [n for n in issue_numbers if n not in missing]
+                moved, _ = self.move_issues(rest, from_sprint, to_sprint)
+            else:
+                moved = e.details.get("moved", [])
+        return moved, [n for n in issue_numbers if n not in moved]
 
     def get_snapshot(self, sprint_number: int, snapshot_type: str) -> dict | None:
         """Get snapshot from the enriched sprint detail endpoint."""
@@ -1,15 +1,19 @@
 """Sprint Dashboard - FastAPI application."""
 
+import asyncio
 import contextlib
 import logging
 import os
+import sqlite3
+from collections.abc import Callable, Iterable
 from datetime import date, timedelta
-from pathlib import Path
+from operator import attrgetter
 from typing import Any
 
+from cachetools import LRUCache, TTLCache
 from fastapi import FastAPI, Query, Request
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import HTMLResponse, RedirectResponse
-from fastapi.templating import Jinja2Templates
 
 from .api import router as api_router
 from .api_v1 import router as api_v1_router
@@ -17,6 +21,7 @@ from .database import close_db, get_db
 from .gitea import (
     BacklogStats,
     BoardData,
+    BoardIssue,
     BurndownData,
     BurndownPoint,
     CIHealth,
@@ -27,16 +32,30 @@ from .gitea import (
     Sprint,
     _parse_closed_date,
     close_all_clients,
+    env_ttl,
+    filter_by_title,
     get_base_client,
     get_client,
 )
 from .health import router as health_router
 from .sprint_store import SprintStore
-from .woodpecker import close_woodpecker_client, get_woodpecker_client
+from .templating import (
+    conditional_template,
+    stream_template,
+    templates,
+    warm_templates,
+)
+from .woodpecker import (
+    WoodpeckerClient,
+    close_woodpecker_client,
+    get_woodpecker_client,
+)
 
 logger = logging.getLogger(__name__)
 
 app = FastAPI(title="Sprint Dashboard")
+# Board and backlog pages/partials are repetitive HTML that compresses well
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 app.include_router(health_router)
 app.include_router(api_router)
 app.include_router(api_v1_router)
@@ -50,9 +69,23 @@ async def shutdown_event():
     close_db()
 
 
-# Templates
-templates_dir = Path(__file__).parent.parent / "templates"
-templates = Jinja2Templates(directory=templates_dir)
+# Sort rank by size: largest first, unsized (99) last
+_SIZE_ORDER: dict[str | None, int] = {"XL": 0, "L": 1, "M": 2, "S": 3}
+
+
+@app.exception_handler(GiteaError)
+@app.exception_handler(ConfigError)
+async def upstream_error(request: Request, exc: Exception):
+    """Render Gitea and configuration failures as the error partial."""
+    return templates.TemplateResponse(
+        "partials/error.html", {"request": request, "error": str(exc)}
+    )
+
+
+@app.on_event("startup")
+async def startup_event():
+    """Compile templates before the first request."""
+    warm_templates()
 
 
 def make_context(
@@ -149,6 +182,99 @@ def _build_board_data(store: SprintStore, client: GiteaClient) -> BoardData:
     )
 
 
+# Built board data per (gitea url, owner, repo), so the board page and the
+# column requests HTMX fires right after it share one build. An entry is
+# reused for BOARD_TTL seconds unless the sprint database has changed.
+BOARD_TTL = env_ttl("SPRINT_DASH_BOARD_TTL", 5)
+_board_cache: TTLCache[
+    tuple[str | None, str, str], tuple[tuple[int, ...], BoardData]
+] = TTLCache(maxsize=32, ttl=BOARD_TTL)
+# One rebuild at a time per key: the build awaits the issue prefetch, so
+# concurrent requests on a cold entry would otherwise each rebuild it.
+# Bounded like the cache; evicting a lock only risks one duplicate build.
+_board_locks: LRUCache[tuple[str | None, str, str], asyncio.Lock] = LRUCache(maxsize=32)
+
+
+def _db_version(conn: sqlite3.Connection) -> tuple[int, ...]:
+    """Token that changes whenever the database may have been written.
+
+    total_changes counts writes on this connection; data_version moves
+    when another connection (e.g. sd-cli in local mode) commits.
+    """
+    (data_version,) = conn.execute("PRAGMA data_version").fetchone()
+    return (id(conn), conn.total_changes, data_version)
+
+
+async def _prefetch_issues(client: GiteaClient, *states: str) -> None:
+    """Load issue lists on worker threads ahead of a synchronous build.
+
+    The builders mix SQLite reads (the connection is bound to the event
+    loop's thread) with client lookups; fetching the lists first turns
+    those lookups into issue-cache hits instead of Gitea requests that
+    block the loop.
+    """
+    await asyncio.gather(
+        *(asyncio.to_thread(client._get_issues, state=state) for state in states)
+    )
+
+
+def _cached_board_data(
+    key: tuple[str | None, str, str], conn: sqlite3.Connection
+) -> BoardData | None:
+    """The memoised board data for key, if still fresh and the DB is unchanged."""
+    cached = _board_cache.get(key)
+    if cached is not None and cached[0] == _db_version(conn):
+        return cached[1]
+    return None
+
+
+async def _get_board_data(store: SprintStore, client: GiteaClient) -> BoardData:
+    """Board data for the store's repo, memoised briefly across requests."""
+    key = (client.base_url, store.repo_owner, store.repo_name)
+    board_data = _cached_board_data(key, store.conn)
+    if board_data is not None:
+        return board_data
+    async with _board_locks.setdefault(key, asyncio.Lock()):
+        # Another request may have rebuilt it while this one waited
+        board_data = _cached_board_data(key, store.conn)
+        if board_data is not None:
+            return board_data
+        await _prefetch_issues(client, "all", "open")
+        # Versioned after the await: the build below doesn't yield, so it
+        # reads exactly the database state this token describes
+        version = _db_version(store.conn)
+        board_data = _build_board_data(store, client)
+        _board_cache[key] = (version, board_data)
+    return board_data
+
+
+def _fetch_ci(
+    wp: WoodpeckerClient | None, owner: str, repo: str
+) -> tuple[CIHealth | None, NightlySummary | None]:
+    """Fetch CI health from Woodpecker (failures never break the page)."""
+    ci_health: CIHealth | None = None
+    nightly: NightlySummary | None = None
+    if wp:
+        with contextlib.suppress(Exception):
+            ci_health = wp.get_ci_health(owner, repo)
+        with contextlib.suppress(Exception):
+            nightly = wp.get_nightly_summary(owner, repo)
+    return ci_health, nightly
+
+
+def _start_ci_fetch(
+    owner: str, repo: str
+) -> asyncio.Future[tuple[CIHealth | None, NightlySummary | None]]:
+    """Start the CI fetch on a worker thread, to overlap with Gitea/DB work.
+
+    The board and sprint data must be built on the event loop (the SQLite
+    connection is bound to it), so the fetch is submitted to the executor
+    immediately rather than awaited as a coroutine.
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(None, _fetch_ci, get_woodpecker_client(), owner, repo)
+
+
 def _build_burndown(
     store: SprintStore, client: GiteaClient, sprint_number: int
 ) -> BurndownData | None:
@@ -219,15 +345,10 @@ def _build_burndown(
 
 
 @app.get("/", response_class=HTMLResponse)
-async def repo_picker(request: Request):
+def repo_picker(request: Request):
     """Repository picker - select which repo to view."""
-    try:
-        client = get_base_client()
-        repos = client.get_user_repos()
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
+    client = get_base_client()
+    repos = client.get_user_repos()
 
     # Group repos by owner
     repos_by_owner: dict[str, list[dict[str, str]]] = {}
@@ -243,38 +364,29 @@ async def repo_picker(request: Request):
 @app.get("/{owner}/{repo}", response_class=HTMLResponse)
 async def home(request: Request, owner: str, repo: str):
     """Dashboard home - shows current sprint and summary."""
-    try:
-        store = _get_store(owner, repo)
-        client = get_client(owner, repo)
-
-        # Build sprints from store
-        sprint_rows = store.list_sprints()
-        sprints: list[Sprint] = []
-        for row in sprint_rows:
-            sprint = _build_sprint(store, client, row["number"])
-            if sprint:
-                sprints.append(sprint)
+    store = _get_store(owner, repo)
+    client = get_client(owner, repo)
+    ci_fetch = _start_ci_fetch(owner, repo)
+    ready_issues, _ = await asyncio.gather(
+        asyncio.to_thread(client._get_issues, state="open", labels="ready"),
+        _prefetch_issues(client, "all"),
+    )
 
-        current = sprints[0] if sprints else None
+    # Build sprints from store
+    sprint_rows = store.list_sprints()
+    sprints: list[Sprint] = []
+    for row in sprint_rows:
+        sprint = _build_sprint(store, client, row["number"])
+        if sprint:
+            sprints.append(sprint)
 
-        # Ready queue: open issues with 'ready' label not in any sprint
-        assigned = store.get_all_assigned_numbers()
-        ready_issues = client._get_issues(state="open", labels="ready")
-        ready_queue = [i for i in ready_issues if i.number not in assigned]
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
+    current = sprints[0] if sprints else None
 
-    # Fetch CI health from Woodpecker (don't let failures break the page)
-    ci_health: CIHealth | None = None
-    nightly: NightlySummary | None = None
-    wp = get_woodpecker_client()
-    if wp:
-        with contextlib.suppress(Exception):
-            ci_health = wp.get_ci_health(owner, repo)
-        with contextlib.suppress(Exception):
-            nightly = wp.get_nightly_summary(owner, repo)
+    # Ready queue: open issues with 'ready' label not in any sprint
+    assigned = store.get_all_assigned_numbers()
+    ready_queue = [i for i in ready_issues if i.number not in assigned]
+
+    ci_health, nightly = await ci_fetch
 
     context = make_context(
         request,
@@ -299,14 +411,49 @@ def _sort_board_issues(issues: list, show_closed: bool = False) -> list:
     if not show_closed:
         issues = [i for i in issues if i.state == "open"]
 
-    # Sort: open first, then P1→P3→None, then L→S→None, then oldest first
-    def sort_key(issue):
-        state_order = 0 if issue.state == "open" else 1
-        priority_order = issue.priority if issue.priority else 99
-        size_order = {"XL": 0, "L": 1, "M": 2, "S": 3}.get(issue.size, 99)
-        return (state_order, priority_order, size_order, issue.created_at)
+    return sorted(issues, key=_board_sort_key)
+
+
+def _filter_board_issues(
+    issues: Iterable,
+    *,
+    type_filter: str = "",
+    epic_filter: str = "",
+    show_closed: bool = False,
+    ready_only: bool = False,
+) -> list:
+    """Apply the board's issue filters in one pass and sort for display."""
+    return sorted(
+        (
+            i
+            for i in issues
+            if (show_closed or i.state == "open")
+            and (not ready_only or i.is_ready)
+            and (not type_filter or i.issue_type == type_filter)
+            and (not epic_filter or i.epic == epic_filter)
+        ),
+        key=_board_sort_key,
+    )
+
 
-    return sorted(issues, key=sort_key)
+def _open_flag_counts(board_issues: list[BoardIssue]) -> tuple[int, int]:
+    """(blocked, needs polish) counts over open issues; closed ones are done."""
+    blocked = polish = 0
+    for bi in board_issues:
+        if bi.state == "open":
+            blocked += bi.is_blocked
+            polish += bi.needs_polish
+    return blocked, polish
+
+
+def _board_sort_key(issue) -> tuple:
+    """Open first, then P1→P3→None, then L→S→None, then oldest first."""
+    return (
+        0 if issue.state == "open" else 1,
+        issue.priority or 99,
+        _SIZE_ORDER.get(issue.size, 99),
+        issue.created_at,
+    )
 
 
 @app.get("/{owner}/{repo}/board", response_class=HTMLResponse)
@@ -321,42 +468,25 @@ async def board(
     group_by_epic: bool = Query(default=False),
 ):
     """Sprint board view - 5 columns: Backlog, Previous, Current, Next, Next+1."""
-    try:
-        store = _get_store(owner, repo)
-        client = get_client(owner, repo)
-        board_data = _build_board_data(store, client)
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
-
-    # Fetch CI health from Woodpecker (don't let failures break the page)
-    ci_health: CIHealth | None = None
-    nightly: NightlySummary | None = None
-    wp = get_woodpecker_client()
-    if wp:
-        with contextlib.suppress(Exception):
-            ci_health = wp.get_ci_health(owner, repo)
-        with contextlib.suppress(Exception):
-            nightly = wp.get_nightly_summary(owner, repo)
-
-    # Apply filters to backlog
-    backlog = board_data.backlog
-    if type_filter:
-        backlog = [i for i in backlog if i.issue_type == type_filter]
-    if epic_filter:
-        backlog = [i for i in backlog if i.epic == epic_filter]
-
-    # Get ready-only backlog for the board
-    ready_backlog = [i for i in backlog if i.is_ready]
-    ready_backlog = _sort_board_issues(ready_backlog, show_closed)
+    store = _get_store(owner, repo)
+    client = get_client(owner, repo)
+    ci_fetch = _start_ci_fetch(owner, repo)
+    board_data = await _get_board_data(store, client)
+    ci_health, nightly = await ci_fetch
+
+    # Ready-only backlog for the board, filtered and sorted
+    ready_backlog = _filter_board_issues(
+        board_data.backlog,
+        type_filter=type_filter,
+        epic_filter=epic_filter,
+        show_closed=show_closed,
+        ready_only=True,
+    )
     # Convert to BoardIssues with dependency info
-    ready_backlog_board = client.to_board_issues(ready_backlog)
+    ready_backlog_board = await asyncio.to_thread(client.to_board_issues, ready_backlog)
 
     # Count blocked issues in backlog (only open issues)
-    backlog_blocked_count = sum(
-        1 for bi in ready_backlog_board if bi.state == "open" and bi.is_blocked
-    )
+    backlog_blocked_count, _ = _open_flag_counts(ready_backlog_board)
 
     # Build sprint lookup by number
     sprint_by_num = {s.number: s for s in board_data.sprints}
@@ -384,28 +514,20 @@ async def board(
     # Sort issues within each sprint and convert to BoardIssues
     sorted_sprint_columns = []
     for sprint in sprint_columns:
-        issues = list(sprint.issues)
-        if type_filter:
-            issues = [i for i in issues if i.issue_type == type_filter]
-        if epic_filter:
-            issues = [i for i in issues if i.epic == epic_filter]
-        sorted_issues = _sort_board_issues(issues, show_closed)
-        board_issues = client.to_board_issues(sorted_issues)
-        # Only count blocked/polish for open issues (closed issues are done)
-        blocked_count = sum(
-            1 for bi in board_issues if bi.state == "open" and bi.is_blocked
-        )
-        polish_count = sum(
-            1 for bi in board_issues if bi.state == "open" and bi.needs_polish
+        sorted_issues = _filter_board_issues(
+            sprint.issues,
+            type_filter=type_filter,
+            epic_filter=epic_filter,
+            show_closed=show_closed,
         )
+        board_issues = await asyncio.to_thread(client.to_board_issues, sorted_issues)
+        blocked_count, polish_count = _open_flag_counts(board_issues)
         sorted_sprint_columns.append(
             (sprint, board_issues, blocked_count, polish_count)
         )
 
-    # Get filter options
-    all_issues = board_data.backlog + [i for s in board_data.sprints for i in s.issues]
-    all_types = sorted({i.issue_type for i in all_issues if i.issue_type != "unknown"})
-    all_epics = sorted({i.epic for i in all_issues if i.epic})
+    # Filter options (computed once per board data build)
+    all_types, all_epics = board_data.filter_options
 
     context = make_context(
         request,
@@ -430,9 +552,9 @@ async def board(
     )
 
     if request.headers.get("HX-Request"):
-        return templates.TemplateResponse("partials/board_content.html", context)
+        return conditional_template(request, "partials/board_content.html", context)
 
-    return templates.TemplateResponse("board.html", context)
+    return stream_template("board.html", context)
 
 
 @app.get("/{owner}/{repo}/board/column/{column_type}", response_class=HTMLResponse)
@@ -447,14 +569,9 @@ async def board_column(
     epic_filter: str = Query(default=""),
 ):
     """Lazy-load a single board column."""
-    try:
-        store = _get_store(owner, repo)
-        client = get_client(owner, repo)
-        board_data = _build_board_data(store, client)
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
+    store = _get_store(owner, repo)
+    client = get_client(owner, repo)
+    board_data = await _get_board_data(store, client)
 
     issues = []
     column_title = ""
@@ -475,29 +592,23 @@ async def board_column(
                 f"{sprint.closed_count}/{sprint.total} done ({sprint.progress_pct}%)"
             )
 
-    # Apply filters
-    if type_filter:
-        issues = [i for i in issues if i.issue_type == type_filter]
-    if epic_filter:
-        issues = [i for i in issues if i.epic == epic_filter]
-
-    issues = _sort_board_issues(issues, show_closed)
+    issues = _filter_board_issues(
+        issues,
+        type_filter=type_filter,
+        epic_filter=epic_filter,
+        show_closed=show_closed,
+    )
 
     # Convert to BoardIssues with dependency info (consistent with full board view)
-    board_issues = client.to_board_issues(issues)
-    # Only count blocked/polish for open issues (closed issues are done)
-    blocked_count = sum(
-        1 for bi in board_issues if bi.state == "open" and bi.is_blocked
-    )
-    polish_count = sum(
-        1 for bi in board_issues if bi.state == "open" and bi.needs_polish
-    )
+    board_issues = await asyncio.to_thread(client.to_board_issues, issues)
+    blocked_count, polish_count = _open_flag_counts(board_issues)
 
     # Build enhanced column_stats with polish count (consistent with main board)
     if polish_count > 0:
         column_stats = column_stats.replace(" done", f" done ({polish_count} polish)")
 
-    return templates.TemplateResponse(
+    return conditional_template(
+        request,
         "partials/board_column.html",
         make_context(
             request,
@@ -516,19 +627,15 @@ async def board_column(
 @app.get("/{owner}/{repo}/sprints", response_class=HTMLResponse)
 async def sprints_list(request: Request, owner: str, repo: str):
     """List all sprints."""
-    try:
-        store = _get_store(owner, repo)
-        client = get_client(owner, repo)
-        sprint_rows = store.list_sprints()
-        sprints: list[Sprint] = []
-        for row in sprint_rows:
-            sprint = _build_sprint(store, client, row["number"])
-            if sprint:
-                sprints.append(sprint)
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
+    store = _get_store(owner, repo)
+    client = get_client(owner, repo)
+    await _prefetch_issues(client, "all")
+    sprint_rows = store.list_sprints()
+    sprints: list[Sprint] = []
+    for row in sprint_rows:
+        sprint = _build_sprint(store, client, row["number"])
+        if sprint:
+            sprints.append(sprint)
 
     context = make_context(request, owner, repo, sprints=sprints)
 
@@ -542,18 +649,14 @@ async def sprints_list(request: Request, owner: str, repo: str):
 @app.get("/{owner}/{repo}/sprints/{number}", response_class=HTMLResponse)
 async def sprint_detail(request: Request, owner: str, repo: str, number: int):
     """Sprint detail view."""
-    try:
-        store = _get_store(owner, repo)
-        client = get_client(owner, repo)
-        sprint = _build_sprint(store, client, number)
-        if sprint is None:
-            return templates.TemplateResponse(
-                "partials/error.html",
-                {"request": request, "error": f"Sprint {number} not found"},
-            )
-    except (GiteaError, ConfigError) as e:
+    store = _get_store(owner, repo)
+    client = get_client(owner, repo)
+    await _prefetch_issues(client, "all")
+    sprint = _build_sprint(store, client, number)
+    if sprint is None:
         return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
+            "partials/error.html",
+            {"request": request, "error": f"Sprint {number} not found"},
         )
 
     # Fetch burndown data from store dates (suppressed errors)
@@ -581,30 +684,33 @@ async def sprint_detail(request: Request, owner: str, repo: str, number: int):
     return templates.TemplateResponse("sprint_detail.html", context)
 
 
+def _priority_key(issue) -> tuple[int, int]:
+    # P1 first (lowest number), issues without priority last
+    return (issue.priority or 99, issue.number)
+
+
+def _size_key(issue) -> tuple[int, int]:
+    # L first (most points), issues without size last
+    return (_SIZE_ORDER.get(issue.size, 99), issue.number)
+
+
+# Backlog sort name -> (key function, sorts descending by default)
+_SORT_KEYS: dict[str, tuple[Callable[[Any], Any], bool]] = {
+    "priority": (_priority_key, False),
+    "size": (_size_key, False),
+    "age": (attrgetter("created_at"), False),  # oldest first
+    "updated": (attrgetter("updated_at"), True),  # most recently updated first
+    "number": (attrgetter("number"), False),
+}
+
+
 def _sort_issues(issues: list, sort: str, reverse: bool = False) -> list:
     """Sort issues by the given field."""
-    if sort == "priority":
-        # P1 first (lowest number), issues without priority last
-        return sorted(
-            issues, key=lambda i: (i.priority or 99, i.number), reverse=reverse
-        )
-    elif sort == "size":
-        # L first (most points), issues without size last
-        size_order = {"XL": 0, "L": 1, "M": 2, "S": 3, None: 99}
-        return sorted(
-            issues,
-            key=lambda i: (size_order.get(i.size, 99), i.number),
-            reverse=reverse,
-        )
-    elif sort == "age":
-        # Oldest first
-        return sorted(issues, key=lambda i: i.created_at, reverse=reverse)
-    elif sort == "updated":
-        # Most recently updated first
-        return sorted(issues, key=lambda i: i.updated_at, reverse=not reverse)
-    elif sort == "number":
-        return sorted(issues, key=lambda i: i.number, reverse=reverse)
-    return issues
+    spec = _SORT_KEYS.get(sort)
+    if spec is None:
+        return issues
+    key, descending = spec
+    return sorted(issues, key=key, reverse=reverse != descending)
 
 
 @app.get("/{owner}/{repo}/backlog", response_class=HTMLResponse)
@@ -620,43 +726,47 @@ async def backlog(
     view: str = Query(default="list"),  # list or epic
 ):
     """Backlog view with sorting and filtering."""
-    try:
-        store = _get_store(owner, repo)
-        client = get_client(owner, repo)
-        # Backlog: open issues not in any sprint
-        assigned = store.get_all_assigned_numbers()
-        all_open = client._get_issues(state="open")
-        all_backlog = [i for i in all_open if i.number not in assigned]
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
-
+    store = _get_store(owner, repo)
+    client = get_client(owner, repo)
+    # Backlog: open issues not in any sprint
+    assigned = store.get_all_assigned_numbers()
+    all_open = await asyncio.to_thread(client._get_issues, state="open")
     # Exclude epic tracking issues (they live on the epics screen)
-    all_backlog = [i for i in all_backlog if not i.is_epic_tracking]
-
-    # Filter issues
-    issues = all_backlog
-    if ready_only:
-        issues = [i for i in issues if i.is_ready]
-    if epic:
-        issues = [i for i in issues if i.epic == epic]
-    if type:
-        issues = [i for i in issues if i.issue_type == type]
-    if size:
-        issues = [i for i in issues if i.size == size]
+    all_backlog = [
+        i for i in all_open if i.number not in assigned and not i.is_epic_tracking
+    ]
+
+    # Filter issues and collect ready issues and dropdown values in one pass
+    issues = []
+    ready_issues = []
+    epic_values: set[str] = set()
+    type_values: set[str] = set()
+    for i in all_backlog:
+        if i.epic:
+            epic_values.add(i.epic)
+        if i.issue_type != "unknown":
+            type_values.add(i.issue_type)
+        if i.is_ready:
+            ready_issues.append(i)
+        elif ready_only:
+            continue
+        if (
+            (not epic or i.epic == epic)
+            and (not type or i.issue_type == type)
+            and (not size or i.size == size)
+        ):
+            issues.append(i)
 
     # Sort issues
     issues = _sort_issues(issues, sort)
 
     # Compute stats
-    ready_issues = [i for i in all_backlog if i.is_ready]
     stats = BacklogStats(issues=issues)
     ready_stats = BacklogStats(issues=ready_issues)
 
-    # Get unique values for filter dropdowns
-    all_epics = sorted({i.epic for i in all_backlog if i.epic})
-    all_types = sorted({i.issue_type for i in all_backlog if i.issue_type != "unknown"})
+    # Unique values for filter dropdowns
+    all_epics = sorted(epic_values)
+    all_types = sorted(type_values)
 
     context = make_context(
         request,
@@ -678,21 +788,16 @@ async def backlog(
 
     if request.headers.get("HX-Request"):
         # Return just the issue list for HTMX updates
-        return templates.TemplateResponse("partials/backlog_list.html", context)
+        return conditional_template(request, "partials/backlog_list.html", context)
 
-    return templates.TemplateResponse("backlog.html", context)
+    return stream_template("backlog.html", context)
 
 
 @app.get("/{owner}/{repo}/epics", response_class=HTMLResponse)
-async def epics(request: Request, owner: str, repo: str):
+def epics(request: Request, owner: str, repo: str):
     """Epic progress view - shows all epics with progress bars and sprint breakdowns."""
-    try:
-        client = get_client(owner, repo)
-        epic_summaries = client.get_epic_summaries()
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
+    client = get_client(owner, repo)
+    epic_summaries = client.get_epic_summaries()
 
     context = make_context(request, owner, repo, epics=epic_summaries)
 
@@ -703,15 +808,10 @@ async def epics(request: Request, owner: str, repo: str):
 
 
 @app.get("/{owner}/{repo}/search", response_class=HTMLResponse)
-async def search(request: Request, owner: str, repo: str, q: str = Query(default="")):
+def search(request: Request, owner: str, repo: str, q: str = Query(default="")):
     """Search issues."""
-    try:
-        client = get_client(owner, repo)
-        issues = client.search_issues(q) if q else []
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
+    client = get_client(owner, repo)
+    issues = client.search_issues(q) if q else []
 
     context = make_context(request, owner, repo, query=q, issues=issues)
 
@@ -727,16 +827,14 @@ async def search(request: Request, owner: str, repo: str, q: str = Query(default
 @app.get("/{owner}/{repo}/issues/{number}", response_class=HTMLResponse)
 async def issue_detail(request: Request, owner: str, repo: str, number: int):
     """Issue detail view with description, comments, and dependencies."""
-    try:
-        client = get_client(owner, repo)
-        issue = client.get_issue(number)
-        comments = client.get_issue_comments(number)
-        depends_on = client.get_issue_dependencies(number)
-        blocks = client.get_issue_blocks(number)
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
+    client = get_client(owner, repo)
+    # Independent round trips: run them concurrently off the event loop
+    issue, comments, depends_on, blocks = await asyncio.gather(
+        asyncio.to_thread(client.get_issue, number),
+        asyncio.to_thread(client.get_issue_comments, number),
+        asyncio.to_thread(client.get_issue_dependencies, number),
+        asyncio.to_thread(client.get_issue_blocks, number),
+    )
 
     context = make_context(
         request,
@@ -755,7 +853,7 @@ async def issue_detail(request: Request, owner: str, repo: str, number: int):
 
 
 @app.get("/{owner}/{repo}/issues", response_class=HTMLResponse)
-async def issues_filtered(
+def issues_filtered(
     request: Request,
     owner: str,
     repo: str,
@@ -764,18 +862,12 @@ async def issues_filtered(
     state: str = Query(default="all"),
 ):
     """Filter issues with HTMX support."""
-    try:
-        client = get_client(owner, repo)
-        issues = client._get_issues(state=state, labels=label if label else None)
-    except (GiteaError, ConfigError) as e:
-        return templates.TemplateResponse(
-            "partials/error.html", {"request": request, "error": str(e)}
-        )
+    client = get_client(owner, repo)
+    issues = client._get_issues(state=state, labels=label if label else None)
 
     # Client-side filter by query
     if q:
-        q_lower = q.lower()
-        issues = [i for i in issues if q_lower in i.title.lower()]
+        issues = filter_by_title(issues, q)
 
     return templates.TemplateResponse(
         "partials/issue_list.html",
@@ -3,6 +3,7 @@
 import json
 import sqlite3
 from datetime import UTC, datetime
+from typing import Any
 
 
 class SprintStore:
@@ -135,26 +136,28 @@ class SprintStore:
         self.conn.commit()
         return self.get_sprint(number)
 
-    def list_sprints(self, *, status: str | None = None) -> list[dict]:
+    def list_sprints(
+        self, *, status: str | None = None, limit: int | None = None
+    ) -> list[dict]:
         """List sprints, optionally filtered by status.
 
+        Args:
+            status: Only return sprints with this status.
+            limit: Return at most this many sprints (the newest).
+
         Returns:
             List of sprint dicts, ordered by number descending.
         """
+        sql = "SELECT * FROM sprints WHERE repo_owner = ? AND repo_name = ?"
+        params: list[Any] = [self.repo_owner, self.repo_name]
         if status:
-            rows = self.conn.execute(
-                """SELECT * FROM sprints
-                   WHERE repo_owner = ? AND repo_name = ? AND status = ?
-                   ORDER BY number DESC""",
-                (self.repo_owner, self.repo_name, status),
-            ).fetchall()
-        else:
-            rows = self.conn.execute(
-                """SELECT * FROM sprints
-                   WHERE repo_owner = ? AND repo_name = ?
-                   ORDER BY number DESC""",
-                (self.repo_owner, self.repo_name),
-            ).fetchall()
+            sql += " AND status = ?"
+            params.append(status)
+        sql += " ORDER BY number DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        rows = self.conn.execute(sql, params).fetchall()
         return [dict(r) for r in rows]
 
     def get_current_sprint_number(self) -> int | None:
@@ -476,22 +479,7 @@ class SprintStore:
         if sprint["status"] in self._FROZEN_STATUSES:
             return False
 
-        # Check if already active in this sprint
-        existing = self.conn.execute(
-            """SELECT 1 FROM sprint_issues
-               WHERE sprint_id = ? AND issue_number = ? AND removed_at IS NULL""",
-            (sprint["id"], issue_number),
-        ).fetchone()
-        if existing:
-            return True
-
-        # Use explicit timestamp to avoid collisions with recently-removed rows
-        now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S.%f")
-        self.conn.execute(
-            """INSERT INTO sprint_issues (sprint_id, issue_number, source, added_at)
-               VALUES (?, ?, ?, ?)""",
-            (sprint["id"], issue_number, source, now),
-        )
+        self._insert_issue(sprint["id"], issue_number, source)
         self.conn.commit()
         return True
 
@@ -508,14 +496,104 @@ class SprintStore:
             return False
 
         now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+        removed = self._soft_remove_issue(sprint["id"], issue_number, now)
+        self.conn.commit()
+        return removed
+
+    def _insert_issue(self, sprint_id: int, issue_number: int, source: str) -> None:
+        """Insert an active sprint_issues row unless one exists (no commit)."""
+        existing = self.conn.execute(
+            """SELECT 1 FROM sprint_issues
+               WHERE sprint_id = ? AND issue_number = ? AND removed_at IS NULL""",
+            (sprint_id, issue_number),
+        ).fetchone()
+        if existing:
+            return
+
+        # Use explicit timestamp to avoid collisions with recently-removed rows
+        add_ts = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S.%f")
+        self.conn.execute(
+            """INSERT INTO sprint_issues (sprint_id, issue_number, source, added_at)
+               VALUES (?, ?, ?, ?)""",
+            (sprint_id, issue_number, source, add_ts),
+        )
+
+    def _soft_remove_issue(self, sprint_id: int, issue_number: int, now: str) -> bool:
+        """Set removed_at on an active sprint_issues row (no commit).
+
+        Returns:
+            True if a row was removed.
+        """
         cursor = self.conn.execute(
             """UPDATE sprint_issues SET removed_at = ?
                WHERE sprint_id = ? AND issue_number = ? AND removed_at IS NULL""",
-            (now, sprint["id"], issue_number),
+            (now, sprint_id, issue_number),
         )
-        self.conn.commit()
         return cursor.rowcount > 0
 
+    def add_issues(
+        self,
+        sprint_number: int,
+        issue_numbers: list[int],
+        *,
+        source: str = "manual",
+    ) -> tuple[list[int], list[int]]:
+        """Add several issues to a sprint in one transaction (see add_issue).
+
+        If the sprint is missing or frozen every issue fails. An error
+        partway through rolls the whole batch back.
+
+        Returns:
+            (added, failed) issue numbers.
+        """
+        sprint = self.get_sprint(sprint_number)
+        if not sprint or sprint["status"] in self._FROZEN_STATUSES:
+            return [], list(issue_numbers)
+
+        self.conn.execute("SAVEPOINT add_issues")
+        try:
+            for num in issue_numbers:
+                self._insert_issue(sprint["id"], num, source)
+            self.conn.execute("RELEASE add_issues")
+        except Exception:
+            self.conn.execute("ROLLBACK TO add_issues")
+            self.conn.execute("RELEASE add_issues")
+            raise
+        self.conn.commit()
+        return list(issue_numbers), []
+
+    def remove_issues(
+        self, sprint_number: int, issue_numbers: list[int]
+    ) -> tuple[list[int], list[int]]:
+        """Remove several issues from a sprint in one transaction.
+
+        See remove_issue. An error partway through rolls the whole batch back.
+
+        Returns:
+            (removed, failed) issue numbers.
+        """
+        sprint = self.get_sprint(sprint_number)
+        if not sprint or sprint["status"] in self._FROZEN_STATUSES:
+            return [], list(issue_numbers)
+
+        now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+        removed: list[int] = []
+        failed: list[int] = []
+        self.conn.execute("SAVEPOINT remove_issues")
+        try:
+            for num in issue_numbers:
+                if self._soft_remove_issue(sprint["id"], num, now):
+                    removed.append(num)
+                else:
+                    failed.append(num)
+            self.conn.execute("RELEASE remove_issues")
+        except Exception:
+            self.conn.execute("ROLLBACK TO remove_issues")
+            self.conn.execute("RELEASE remove_issues")
+            raise
+        self.conn.commit()
+        return removed, failed
+
     def get_issue_numbers(self, sprint_number: int) -> list[int]:
         """Get active issue numbers for a sprint (removed_at IS NULL).
 
@@ -579,42 +657,76 @@ class SprintStore:
             return False
 
         now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
-        add_ts = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S.%f")
 
         self.conn.execute("SAVEPOINT move_issue")
         try:
-            # Soft-remove from source
-            cursor = self.conn.execute(
-                """UPDATE sprint_issues SET removed_at = ?
-                   WHERE sprint_id = ? AND issue_number = ? AND removed_at IS NULL""",
-                (now, from_row["id"], issue_number),
+            moved = self._move_issue_row(
+                from_row["id"], to_row["id"], issue_number, now
             )
-            if cursor.rowcount == 0:
-                self.conn.execute("ROLLBACK TO move_issue")
-                self.conn.execute("RELEASE move_issue")
-                return False
-
-            # Check if already active in target
-            existing = self.conn.execute(
-                """SELECT 1 FROM sprint_issues
-                   WHERE sprint_id = ? AND issue_number = ? AND removed_at IS NULL""",
-                (to_row["id"], issue_number),
-            ).fetchone()
-            if not existing:
-                self.conn.execute(
-                    """INSERT INTO sprint_issues (sprint_id, issue_number, source, added_at)
-                       VALUES (?, ?, 'manual', ?)""",
-                    (to_row["id"], issue_number, add_ts),
-                )
-
             self.conn.execute("RELEASE move_issue")
         except Exception:
             self.conn.execute("ROLLBACK TO move_issue")
             self.conn.execute("RELEASE move_issue")
             raise
         self.conn.commit()
+        return moved
+
+    def _move_issue_row(
+        self, from_id: int, to_id: int, issue_number: int, now: str
+    ) -> bool:
+        """Soft-remove from the source sprint and add to the target (no commit).
+
+        Returns:
+            False (with nothing changed) if the issue isn't active in the source.
+        """
+        if not self._soft_remove_issue(from_id, issue_number, now):
+            return False
+        self._insert_issue(to_id, issue_number, "manual")
         return True
 
+    def move_issues(
+        self,
+        issue_numbers: list[int],
+        from_sprint: int,
+        to_sprint: int,
+    ) -> tuple[list[int], list[int]]:
+        """Move several issues between sprints in one transaction.
+
+        See move_issue. An error partway through rolls the whole batch back.
+
+        Returns:
+            (moved, failed) issue numbers.
+        """
+        if from_sprint == to_sprint:
+            return [], list(issue_numbers)
+        from_row = self.get_sprint(from_sprint)
+        to_row = self.get_sprint(to_sprint)
+        if (
+            not from_row
+            or not to_row
+            or from_row["status"] in self._FROZEN_STATUSES
+            or to_row["status"] in self._FROZEN_STATUSES
+        ):
+            return [], list(issue_numbers)
+
+        now = datetime.now(UTC).strftime("%Y-%m-%d %H:%M:%S")
+        moved: list[int] = []
+        failed: list[int] = []
+        self.conn.execute("SAVEPOINT move_issues")
+        try:
+            for num in issue_numbers:
+                if self._move_issue_row(from_row["id"], to_row["id"], num, now):
+                    moved.append(num)
+                else:
+                    failed.append(num)
+            self.conn.execute("RELEASE move_issues")
+        except Exception:
+            self.conn.execute("ROLLBACK TO move_issues")
+            self.conn.execute("RELEASE move_issues")
+            raise
+        self.conn.commit()
+        return moved, failed
+
     def carry_over(
         self,
         from_sprint: int,
@@ -0,0 +1,85 @@
+"""Shared Jinja2 templates for the page and HTMX routes."""
+
+import hashlib
+import os
+from pathlib import Path
+from typing import Any
+
+from fastapi import Request
+from fastapi.responses import HTMLResponse, Response, StreamingResponse
+from fastapi.templating import Jinja2Templates
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
+
+templates_dir = Path(__file__).parent.parent / "templates"
+
+# Compiled templates are kept for the life of the process (unbounded cache,
+# no per-render mtime checks); set SPRINT_DASH_TEMPLATE_RELOAD=1 to pick up
+# template edits without a restart. SPRINT_DASH_TEMPLATE_CACHE optionally
+# persists compiled bytecode across restarts.
+TEMPLATE_RELOAD = os.getenv("SPRINT_DASH_TEMPLATE_RELOAD") == "1"
+TEMPLATE_CACHE_DIR = os.getenv("SPRINT_DASH_TEMPLATE_CACHE")
+
+
+def _bytecode_cache() -> FileSystemBytecodeCache | None:
+    if not TEMPLATE_CACHE_DIR:
+        return None
+    os.makedirs(TEMPLATE_CACHE_DIR, exist_ok=True)
+    return FileSystemBytecodeCache(TEMPLATE_CACHE_DIR)
+
+
+templates = Jinja2Templates(
+    env=Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(),
+        auto_reload=TEMPLATE_RELOAD,
+        cache_size=-1,
+        bytecode_cache=_bytecode_cache(),
+    )
+)
+
+
+def warm_templates() -> None:
+    """Compile every template up front so first requests don't pay for it."""
+    for name in templates.env.list_templates(extensions=["html"]):
+        templates.get_template(name)
+
+
+def stream_template(
+    name: str, context: dict[str, Any], *, buffer_size: int = 32
+) -> StreamingResponse:
+    """Render a template incrementally instead of building the whole page.
+
+    Used for the largest full pages (board, backlog) so the first chunk goes
+    out before the rest is rendered. Output is grouped into batches of
+    ``buffer_size`` template events to keep the number of writes sensible.
+    Those routes serve a partial to HTMX on the same URL, hence ``Vary``.
+    """
+    stream = templates.get_template(name).stream(context)
+    stream.enable_buffering(buffer_size)
+    return StreamingResponse(
+        stream, media_type="text/html", headers={"Vary": "HX-Request"}
+    )
+
+
+def conditional_template(
+    request: Request, name: str, context: dict[str, Any]
+) -> Response:
+    """Render a template with a content ETag.
+
+    Returns an empty 304 when the client's If-None-Match already matches,
+    so HTMX swaps of an unchanged board or backlog skip the payload. The
+    tag is weak because GZipMiddleware may re-encode the body. ``Vary``
+    keeps caches from handing the partial back for a full-page load of the
+    same URL.
+    """
+    body = templates.get_template(name).render(context).encode()
+    etag = f'W/"{hashlib.blake2s(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Vary": "HX-Request"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return HTMLResponse(body, headers=headers)
@@ -2,6 +2,8 @@
 
 import logging
 import os
+import threading
+import time
 
 import httpx
 from cachetools import TTLCache
@@ -12,16 +14,47 @@ from .gitea import (
     CIHealth,
     NightlyHealth,
     NightlySummary,
+    env_ttl,
 )
 
 logger = logging.getLogger(__name__)
 
+_PIPELINE_WORKFLOW_SET = frozenset(PIPELINE_WORKFLOWS)
+
+# Woodpecker status -> internal status vocabulary
+_STATUS_MAP: dict[str, str] = {
+    "success": "success",
+    "failure": "failure",
+    "running": "running",
+    "pending": "pending",
+    "blocked": "pending",
+    "declined": "cancelled",
+    "error": "failure",
+    "killed": "cancelled",
+}
+
 # Repo ID cache (long-lived — repo IDs don't change)
 _repo_id_cache: TTLCache[str, int] = TTLCache(maxsize=50, ttl=3600)
 
-# CI health caches (60s/5s two-tier)
-_ci_health_cache: TTLCache[str, CIHealth] = TTLCache(maxsize=10, ttl=60)
-_ci_health_failure_cache: TTLCache[str, CIHealth] = TTLCache(maxsize=10, ttl=5)
+# CI health caches (success/failure two-tier). CI state changes on every push,
+# so successes are kept briefly too.
+CI_HEALTH_TTL = env_ttl("SPRINT_DASH_CI_TTL", 15)
+CI_HEALTH_FAILURE_TTL = env_ttl("SPRINT_DASH_CI_FAILURE_TTL", 5)
+_ci_health_cache: TTLCache[str, CIHealth] = TTLCache(maxsize=10, ttl=CI_HEALTH_TTL)
+_ci_health_failure_cache: TTLCache[str, CIHealth] = TTLCache(
+    maxsize=10, ttl=CI_HEALTH_FAILURE_TTL
+)
+# Guards the CI health caches, which the background poller writes concurrently
+_ci_health_lock = threading.Lock()
+
+# Background CI poll intervals (seconds). Healthy results are refreshed well
+# inside the cache TTL so readers never see it expire; failures are retried
+# on the failure cache's cadence.
+CI_POLL_INTERVAL = CI_HEALTH_TTL / 2
+CI_POLL_RETRY_INTERVAL = CI_HEALTH_FAILURE_TTL
+# Repos nobody has read CI health for in this long are dropped from the poll
+# set; the next read fetches inline and registers them again.
+CI_WATCH_EXPIRY = CI_HEALTH_TTL * 4
 
 # Nightly caches (60s/5s two-tier)
 _nightly_cache: TTLCache[str, NightlySummary] = TTLCache(maxsize=10, ttl=60)
@@ -44,7 +77,16 @@ class WoodpeckerClient:
         self,
         base_url: str | None = None,
         token: str | None = None,
+        poll: bool = False,
     ):
+        """Initialize the Woodpecker client.
+
+        Args:
+            base_url: Woodpecker URL (optional, from env if not provided)
+            token: API token (optional, from env if not provided)
+            poll: If True, repos passed to get_ci_health are refreshed by a
+                background thread so requests read CI health from cache
+        """
         resolved_url = base_url if base_url else os.getenv("WOODPECKER_URL", "")
         self.base_url = resolved_url.rstrip("/") if resolved_url else ""
         self.token = token if token else os.getenv("WOODPECKER_TOKEN", "") or ""
@@ -58,19 +100,80 @@ class WoodpeckerClient:
                 "No Woodpecker token configured. Set WOODPECKER_TOKEN in .env."
             )
 
+        # One pooled client for the process: the CI poller and page requests
+        # reuse keep-alive connections (multiplexed over HTTP/2 when served
+        # over https), and transient connect failures are retried instead of
+        # blanking the CI panel
         self._client = httpx.Client(
             base_url=f"{self.base_url}/api",
             headers={
                 "Authorization": f"Bearer {self.token}",
                 "Accept": "application/json",
             },
-            timeout=30.0,
+            timeout=httpx.Timeout(30.0, connect=5.0),
+            transport=httpx.HTTPTransport(
+                http2=True,
+                limits=httpx.Limits(
+                    max_connections=16,
+                    max_keepalive_connections=16,
+                    keepalive_expiry=60.0,
+                ),
+                retries=2,
+            ),
         )
 
+        self._poll = poll
+        # (owner, repo) -> monotonic time of the last CI health read
+        self._watched: dict[tuple[str, str], float] = {}
+        self._stop = threading.Event()
+        self._poller: threading.Thread | None = None
+
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Stop the CI poller (if running) and close the HTTP client."""
+        self._stop.set()
+        if self._poller is not None:
+            self._poller.join(timeout=5)
+            self._poller = None
         self._client.close()
 
+    def _watch(self, owner: str, repo: str) -> None:
+        """Record a read of a repo's CI health, starting the poller if needed."""
+        if not self._poll or self._stop.is_set():
+            return
+        with _ci_health_lock:
+            self._watched[(owner, repo)] = time.monotonic()
+            if self._poller is None:
+                self._poller = threading.Thread(
+                    target=self._ci_poller, name="woodpecker-ci-poller", daemon=True
+                )
+                self._poller.start()
+
+    def _ci_poller(self) -> None:
+        """Refresh CI health for watched repos until close() is called."""
+        while not self._stop.wait(self._poll_interval):
+            cutoff = time.monotonic() - CI_WATCH_EXPIRY
+            with _ci_health_lock:
+                self._watched = {
+                    key: last_read
+                    for key, last_read in self._watched.items()
+                    if last_read >= cutoff
+                }
+                watched = list(self._watched)
+            for owner, repo in watched:
+                if self._stop.is_set():
+                    return
+                self._refresh_ci_health(owner, repo)
+
+    @property
+    def _poll_interval(self) -> float:
+        """Poll quickly while any watched repo is failing, slowly otherwise."""
+        with _ci_health_lock:
+            failing = any(
+                self._ci_health_key(owner, repo) in _ci_health_failure_cache
+                for owner, repo in self._watched
+            )
+        return CI_POLL_RETRY_INTERVAL if failing else CI_POLL_INTERVAL
+
     def __enter__(self) -> "WoodpeckerClient":
         return self
 
@@ -108,17 +211,10 @@ class WoodpeckerClient:
         Woodpecker statuses: success, failure, running, pending,
         blocked, declined, error, killed.
         """
-        mapping = {
-            "success": "success",
-            "failure": "failure",
-            "running": "running",
-            "pending": "pending",
-            "blocked": "pending",
-            "declined": "cancelled",
-            "error": "failure",
-            "killed": "cancelled",
-        }
-        return mapping.get(status.lower(), "unknown")
+        return _STATUS_MAP.get(status.lower(), "unknown")
+
+    def _ci_health_key(self, owner: str, repo: str) -> str:
+        return f"{self.base_url}:{owner}/{repo}:ci_health"
 
     def get_ci_health(self, owner: str, repo: str) -> CIHealth:
         """Get CI pipeline health from Woodpecker.
@@ -131,19 +227,39 @@ class WoodpeckerClient:
         1. GET /repos/{repo_id}/pipelines?per_page=5&event=push
         2. GET /repos/{repo_id}/pipelines/{number} (detail for latest)
 
+        When polling is enabled, only the first call for a repo fetches
+        inline; after that the background poller keeps the cache warm for
+        as long as the repo keeps being read.
+
         Returns CIHealth with per-workflow breakdown, or unknown on error.
         """
-        cache_key = f"{self.base_url}:{owner}/{repo}:ci_health"
-        if cache_key in _ci_health_cache:
-            return _ci_health_cache[cache_key]
-        if cache_key in _ci_health_failure_cache:
-            return _ci_health_failure_cache[cache_key]
+        cache_key = self._ci_health_key(owner, repo)
+        self._watch(owner, repo)
+        with _ci_health_lock:
+            cached = _ci_health_cache.get(cache_key) or _ci_health_failure_cache.get(
+                cache_key
+            )
+        if cached is not None:
+            return cached
+
+        return self._refresh_ci_health(owner, repo)
 
+    def _refresh_ci_health(self, owner: str, repo: str) -> CIHealth:
+        """Fetch CI health from Woodpecker and store it in the caches."""
+        cache_key = self._ci_health_key(owner, repo)
         unknown = CIHealth(sha="?", state="unknown", workflows=())
 
         try:
             repo_id = self._get_repo_id(owner, repo)
+        except WoodpeckerError as e:
+            logger.warning("Failed to fetch Woodpecker CI health: %s", e)
+            # A repo Woodpecker rejects (unknown, not activated) won't resolve
+            # on the retry cadence; only connection failures are transient
+            transient = isinstance(e.__cause__, httpx.RequestError)
+            self._store_ci_health(cache_key, unknown, settled=not transient)
+            return unknown
 
+        try:
             # Fetch latest push pipelines
             resp = self._client.get(
                 f"/repos/{repo_id}/pipelines",
@@ -153,7 +269,8 @@ class WoodpeckerClient:
             pipelines = resp.json()
 
             if not pipelines:
-                _ci_health_failure_cache[cache_key] = unknown
+                # No push pipelines yet is an answer, not a failure to retry
+                self._store_ci_health(cache_key, unknown, settled=True)
                 return unknown
 
             # Latest pipeline is first
@@ -172,31 +289,47 @@ class WoodpeckerClient:
             workflow_list = detail.get("workflows", [])
             pipeline_url = self._pipeline_url(repo_id, pipeline_number)
 
-            workflows: dict[str, tuple[str, str]] = {}
-            for wf_name in PIPELINE_WORKFLOWS:
-                found = False
-                for wf in workflow_list:
-                    if wf.get("name") == wf_name:
-                        status = self._map_status(wf.get("state", "unknown"))
-                        workflows[wf_name] = (status, pipeline_url)
-                        found = True
+            # One pass over the workflows, keeping the first entry per name
+            states: dict[str, str] = {}
+            for wf in workflow_list:
+                name = wf.get("name")
+                if name in _PIPELINE_WORKFLOW_SET and name not in states:
+                    states[name] = wf.get("state", "unknown")
+                    if len(states) == len(_PIPELINE_WORKFLOW_SET):
                         break
-                if not found:
-                    workflows[wf_name] = ("not_run", "")
+
+            workflows: dict[str, tuple[str, str]] = {
+                wf_name: (self._map_status(states[wf_name]), pipeline_url)
+                if wf_name in states
+                else ("not_run", "")
+                for wf_name in PIPELINE_WORKFLOWS
+            }
 
             result = CIHealth.from_workflows(commit_sha, workflows)
-            _ci_health_cache[cache_key] = result
+            self._store_ci_health(cache_key, result, settled=True)
             return result
 
-        except (
-            httpx.HTTPStatusError,
-            httpx.RequestError,
-            WoodpeckerError,
-        ) as e:
+        except (httpx.HTTPStatusError, httpx.RequestError) as e:
             logger.warning("Failed to fetch Woodpecker CI health: %s", e)
-            _ci_health_failure_cache[cache_key] = unknown
+            self._store_ci_health(cache_key, unknown, settled=False)
             return unknown
 
+    @staticmethod
+    def _store_ci_health(cache_key: str, health: CIHealth, *, settled: bool) -> None:
+        """Cache a CI health result in the tier matching its outcome.
+
+        Settled results (real CI state, or a repo with no CI to show) use the
+        regular TTL; transient failures use the short failure TTL and make
+        the poller retry quickly.
+        """
+        with _ci_health_lock:
+            if settled:
+                _ci_health_cache[cache_key] = health
+                _ci_health_failure_cache.pop(cache_key, None)
+            else:
+                _ci_health_failure_cache[cache_key] = health
+                _ci_health_cache.pop(cache_key, None)
+
     def get_nightly_summary(self, owner: str, repo: str) -> NightlySummary | None:
         """Get nightly workflow status from Woodpecker.
 
@@ -299,7 +432,7 @@ def get_woodpecker_client() -> WoodpeckerClient | None:
         return None
 
     try:
-        _client_instance = WoodpeckerClient(base_url=url, token=token)
+        _client_instance = WoodpeckerClient(base_url=url, token=token, poll=True)
         return _client_instance
     except WoodpeckerError as e:
         logger.warning("Failed to initialize Woodpecker client: %s", e)
@@ -4,7 +4,7 @@ Usage:
     sd-cli [--json] [--url URL] [--owner OWNER] [--repo REPO] COMMAND
 
 Commands:
-    sprint list [--status STATUS]     List all sprints
+    sprint list [opts]                List sprints (--status, --limit)
     sprint show NUMBER                Show sprint details with issues
     sprint create NUMBER [opts]       Create a new sprint
     sprint update NUMBER [opts]       Update sprint dates/goal
@@ -118,7 +118,7 @@ def _print_row(d: dict) -> None:
 
 def cmd_sprint_list(args: argparse.Namespace) -> None:
     backend = _get_backend(args)
-    sprints = backend.list_sprints(status=args.status)
+    sprints = backend.list_sprints(status=args.status, limit=args.limit)
     if args.json:
         _output(sprints, json_mode=True)
     else:
@@ -326,13 +326,9 @@ def cmd_issue_list(args: argparse.Namespace) -> None:
 
 def cmd_issue_add(args: argparse.Namespace) -> None:
     backend = _get_backend(args)
-    added = []
-    failed = []
-    for num in args.issues:
-        if backend.add_issue(args.sprint_number, num, source=args.source):
-            added.append(num)
-        else:
-            failed.append(num)
+    added, failed = backend.add_issues(
+        args.sprint_number, args.issues, source=args.source
+    )
 
     if args.json:
         _output(
@@ -352,13 +348,7 @@ def cmd_issue_add(args: argparse.Namespace) -> None:
 
 def cmd_issue_remove(args: argparse.Namespace) -> None:
     backend = _get_backend(args)
-    removed = []
-    failed = []
-    for num in args.issues:
-        if backend.remove_issue(args.sprint_number, num):
-            removed.append(num)
-        else:
-            failed.append(num)
+    removed, failed = backend.remove_issues(args.sprint_number, args.issues)
 
     if args.json:
         _output(
@@ -381,13 +371,7 @@ def cmd_issue_remove(args: argparse.Namespace) -> None:
 
 def cmd_issue_move(args: argparse.Namespace) -> None:
     backend = _get_backend(args)
-    moved = []
-    failed = []
-    for num in args.issues:
-        if backend.move_issue(num, args.from_sprint, args.to_sprint):
-            moved.append(num)
-        else:
-            failed.append(num)
+    moved, failed = backend.move_issues(args.issues, args.from_sprint, args.to_sprint)
 
     if args.json:
         _output(
@@ -441,6 +425,9 @@ def build_parser() -> argparse.ArgumentParser:
     sp_list.add_argument(
         "--status", choices=["planned", "in_progress", "completed", "cancelled"]
     )
+    sp_list.add_argument(
+        "--limit", type=_positive_int, help="Show only the N newest sprints"
+    )
     sp_list.set_defaults(func=cmd_sprint_list)
 
     # sprint show
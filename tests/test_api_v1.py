@@ -91,6 +91,34 @@ class TestListSprints:
         assert len(data) == 1
         assert data[0]["number"] == 2
 
+    def test_limit(self, client, owner, repo):
+        for n in (1, 2, 3):
+            client.post(_url(owner, repo, "/sprints"), json={"number": n})
+
+        resp = client.get(_url(owner, repo, "/sprints"), params={"limit": 2})
+        assert [s["number"] for s in resp.json()] == [3, 2]
+
+        resp = client.get(_url(owner, repo, "/sprints"), params={"limit": 0})
+        assert resp.status_code == 422
+
+    def test_etag_not_modified(self, client, owner, repo):
+        client.post(_url(owner, repo, "/sprints"), json={"number": 1})
+        resp = client.get(_url(owner, repo, "/sprints"))
+        etag = resp.headers["etag"]
+
+        resp = client.get(
+            _url(owner, repo, "/sprints"), headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 304
+        assert resp.content == b""
+
+        client.post(_url(owner, repo, "/sprints"), json={"number": 2})
+        resp = client.get(
+            _url(owner, repo, "/sprints"), headers={"If-None-Match": etag}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["etag"] != etag
+
 
 # --- Sprint detail ---
 
@@ -425,6 +453,37 @@ class TestRemoveIssue:
         assert resp.status_code == 404
 
 
+class TestRemoveIssues:
+    def test_remove_batch(self, client, owner, repo):
+        client.post(_url(owner, repo, "/sprints"), json={"number": 1})
+        client.post(_url(owner, repo, "/sprints/1/issues"), json={"issues": [10, 20]})
+        resp = client.post(
+            _url(owner, repo, "/sprints/1/issues/remove"),
+            json={"issues": [10, 20, 10]},
+        )
+        assert resp.status_code == 200
+        assert resp.json() == {"sprint": 1, "removed": [10, 20]}
+
+    def test_remove_batch_partial(self, client, owner, repo):
+        client.post(_url(owner, repo, "/sprints"), json={"number": 1})
+        client.post(_url(owner, repo, "/sprints/1/issues"), json={"issues": [10]})
+        resp = client.post(
+            _url(owner, repo, "/sprints/1/issues/remove"),
+            json={"issues": [10, 99]},
+        )
+        assert resp.status_code == 404
+        assert resp.json()["removed"] == [10]
+        assert resp.json()["failed"] == [99]
+
+    def test_remove_batch_sprint_not_found(self, client, owner, repo):
+        resp = client.post(
+            _url(owner, repo, "/sprints/99/issues/remove"),
+            json={"issues": [10]},
+        )
+        assert resp.status_code == 404
+        assert resp.json()["code"] == "not_found"
+
+
 # --- Issue move ---
 
 
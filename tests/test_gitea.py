@@ -0,0 +1,962 @@
+"""Tests for Gitea client data models and parsing helpers."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import orjson
+import pytest
+
+from app.gitea import (
+    _EFFORT_RE,
+    EPIC_COLORS,
+    PAGE_LIMIT,
+    BacklogStats,
+    BoardData,
+    BoardIssue,
+    GiteaClient,
+    GiteaError,
+    Issue,
+    Milestone,
+    Sprint,
+    _classify_labels,
+    _current_sprint_number,
+    _deps_cache,
+    _http_clients,
+    _IssuePageStore,
+    _issues_cache,
+    _issues_etag_cache,
+    _issues_inflight,
+    _load_tea_config,
+    _milestones_cache,
+    _milestones_etag_cache,
+    _parse_effort,
+    _parse_issue,
+    _parse_tea_config,
+    _title_index,
+    close_all_clients,
+    env_ttl,
+    get_client,
+    get_epic_color,
+)
+
+
+@pytest.fixture()
+def gitea_factory():
+    """Build GiteaClients whose requests are served by a handler function."""
+    clients = []
+
+    def make(handler) -> GiteaClient:
+        client = GiteaClient(
+            base_url="https://gitea.example.com",
+            token="test-token",
+            owner="owner",
+            repo="repo",
+        )
+        client.close()  # release the real (shared) connection pool
+        client._client = httpx.Client(
+            base_url="https://gitea.example.com/api/v1",
+            transport=httpx.MockTransport(handler),
+        )
+        clients.append(client)
+        return client
+
+    _deps_cache.clear()
+    yield make
+    _deps_cache.clear()
+    for client in clients:
+        client._client.close()
+
+
+def _issue(labels: tuple[str, ...] = (), body: str = "", **kwargs) -> Issue:
+    defaults = {
+        "number": 1,
+        "title": "Test issue",
+        "state": "open",
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "closed_at": None,
+    }
+    defaults.update(kwargs)
+    return Issue(labels=labels, body=body, **defaults)
+
+
+class TestParseEffort:
+    """_parse_effort must agree with the _EFFORT_RE regex it replaces."""
+
+    @pytest.mark.parametrize(
+        ("body", "expected"),
+        [
+            ("## Effort: S", "S"),
+            ("## Effort\nM", "M"),
+            ("##Effort L", "L"),
+            ("**Effort:** XL", "XL"),
+            ("**Effort** m", "M"),
+            ("Intro\n\n## effort:  \n  xl\nmore", "XL"),
+            ("## Effort: Small", None),
+            ("## Effort: XLarge", None),
+            ("**Effort: S**", None),
+            ("Effort: S", None),
+            ("# Effort: S", None),
+            ("## Effort: ?\n**Effort:** L", "L"),
+            ("no effort section here", None),
+            ("", None),
+            ("## Effort: S — naïve", "S"),
+        ],
+    )
+    def test_matches_regex(self, body, expected):
+        assert _parse_effort(body) == expected
+        match = _EFFORT_RE.search(body)
+        assert (match.group(1).upper() if match else None) == expected
+
+
+class TestIssueSize:
+    def test_label_takes_precedence_over_body(self):
+        issue = _issue(labels=("size/m",), body="## Effort: XL")
+        assert issue.size == "M"
+        assert issue.points == 3
+
+    def test_body_fallback(self):
+        assert _issue(body="**Effort:** L").size == "L"
+
+    def test_no_size(self):
+        issue = _issue(body="Just a description")
+        assert issue.size is None
+        assert issue.points == 0
+
+
+def _dep(number: int, state: str = "open", labels: tuple[str, ...] = ()) -> dict:
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "state": state,
+        "labels": [{"name": name} for name in labels],
+    }
+
+
+class TestGetDependencyInfo:
+    def test_fetches_dependencies_and_blocks(self, gitea_factory):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/dependencies"):
+                return httpx.Response(200, json=[_dep(2, labels=("sprint/4",))])
+            return httpx.Response(200, json=[_dep(3), _dep(4, state="closed")])
+
+        client = gitea_factory(handler)
+        assert client.get_dependency_info(1) == (1, 2, [(2, "open", 4)])
+        assert sorted(paths) == [
+            "/api/v1/repos/owner/repo/issues/1/blocks",
+            "/api/v1/repos/owner/repo/issues/1/dependencies",
+        ]
+
+        # Second call is served from the cache
+        client.get_dependency_info(1)
+        assert len(paths) == 2
+
+    def test_dependency_sprint_from_labels(self, gitea_factory):
+        def handler(request: httpx.Request) -> httpx.Response:
+            labels = ("bug", "sprint/x", "sprint/9", "sprint/10")
+            return httpx.Response(200, json=[_dep(2, labels=labels)])
+
+        client = gitea_factory(handler)
+        assert client.get_issue_dependencies(1)[0].sprint == 9
+
+    def test_skip_blocks(self, gitea_factory):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(200, json=[_dep(2)])
+
+        client = gitea_factory(handler)
+        assert client.get_dependency_info(1, fetch_blocks=False) == (
+            1,
+            0,
+            [(2, "open", None)],
+        )
+        assert paths == ["/api/v1/repos/owner/repo/issues/1/dependencies"]
+
+    def test_blocks_error_returns_empty(self, gitea_factory):
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.url.path.endswith("/blocks"):
+                return httpx.Response(500)
+            return httpx.Response(200, json=[_dep(2)])
+
+        client = gitea_factory(handler)
+        assert client.get_dependency_info(1) == (0, 0, [])
+        assert not _deps_cache
+
+
+class TestBoardIssue:
+    def test_forwards_issue_fields(self):
+        issue = _issue(
+            labels=("sprint/3", "size/l", "priority/high", "epic/auth", "ready"),
+            body="text",
+            number=42,
+        )
+        board_issue = BoardIssue(issue=issue, blocked_by_count=1)
+        assert board_issue.number == 42
+        assert board_issue.title == issue.title
+        assert board_issue.labels == issue.labels
+        assert board_issue.body == "text"
+        assert board_issue.sprint == 3
+        assert board_issue.size == "L"
+        assert board_issue.points == issue.points
+        assert board_issue.priority == issue.priority
+        assert board_issue.epic == issue.epic
+        assert board_issue.issue_type == issue.issue_type
+        assert board_issue.is_ready
+        assert board_issue.blocked_by_count == 1
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            BoardIssue(issue=_issue()).no_such_field  # noqa: B018
+
+    @pytest.mark.parametrize(
+        ("sprint_label", "blockers", "expected"),
+        [
+            ("sprint/5", [], ""),
+            ("sprint/5", [(1, "closed", 4)], ""),
+            ("sprint/5", [(1, "open", 6), (2, "open", 5)], "S0"),
+            ("sprint/5", [(1, "open", 6), (2, "open", None)], "BL"),
+            ("sprint/5", [(1, "open", None), (2, "open", 4)], "S-1"),
+            ("sprint/5", [(1, "open", 7)], "S+1"),
+            (None, [(1, "open", 3)], ""),
+            (None, [(1, "open", 3), (2, "open", None)], "BL"),
+        ],
+    )
+    def test_blocker_context(self, sprint_label, blockers, expected):
+        labels = (sprint_label,) if sprint_label else ()
+        board_issue = BoardIssue(issue=_issue(labels=labels), blockers=blockers)
+        assert board_issue.blocker_context == expected
+
+    def test_slotted(self):
+        assert not hasattr(BoardIssue(issue=_issue()), "__dict__")
+
+
+class TestBoardData:
+    def _board(self, numbers: list[int], current: int | None) -> BoardData:
+        sprints = [Sprint(number=n, issues=()) for n in numbers]
+        return BoardData(backlog=[], sprints=sprints, current_sprint_num=current)
+
+    def test_get_sprint(self):
+        board = self._board([5, 4, 3], current=4)
+        assert board.get_sprint(3).number == 3
+        assert board.get_sprint(9) is None
+
+    def test_current_sprint(self):
+        assert self._board([5, 4, 3], current=4).current_sprint.number == 4
+
+    def test_current_sprint_falls_back_to_first(self):
+        assert self._board([5, 4], current=9).current_sprint.number == 5
+        assert self._board([5, 4], current=None).current_sprint.number == 5
+        assert self._board([], current=None).current_sprint is None
+
+    def test_next_sprints_keeps_order(self):
+        board = self._board([6, 5, 4, 3], current=4)
+        assert [s.number for s in board.next_sprints] == [6, 5]
+        assert board.next_sprints is board.next_sprints
+
+    def test_next_sprints_without_current(self):
+        assert self._board([6, 5], current=None).next_sprints == []
+
+    def test_filter_options(self):
+        board = BoardData(
+            backlog=[_issue(("bug", "epic/auth")), _issue(())],
+            sprints=[
+                Sprint(number=2, issues=(_issue(("feature", "epic/api")),)),
+                Sprint(number=1, issues=(_issue(("bug", "epic/auth")),)),
+            ],
+            current_sprint_num=2,
+        )
+        assert board.filter_options == (("bug", "feature"), ("api", "auth"))
+
+
+class TestLoadTeaConfig:
+    @pytest.fixture()
+    def config_path(self, tmp_path):
+        path = tmp_path / "config.yml"
+        _parse_tea_config.cache_clear()
+        with patch("app.gitea._get_tea_config_path", return_value=path):
+            yield path
+        _parse_tea_config.cache_clear()
+
+    def test_missing_file(self, config_path):
+        assert _load_tea_config() is None
+
+    def test_parses_once_while_unchanged(self, config_path):
+        config_path.write_text("logins:\n  - name: a\n    url: https://a\n")
+        first = _load_tea_config()
+        assert first == {"logins": [{"name": "a", "url": "https://a"}]}
+        assert _load_tea_config() is first
+        assert _parse_tea_config.cache_info().hits == 1
+
+    def test_reparses_after_change(self, config_path):
+        config_path.write_text("logins: []\n")
+        assert _load_tea_config() == {"logins": []}
+        config_path.write_text("logins:\n  - name: b\n")
+        assert _load_tea_config() == {"logins": [{"name": "b"}]}
+
+    def test_invalid_yaml(self, config_path):
+        config_path.write_text("logins: [unclosed\n")
+        assert _load_tea_config() is None
+
+
+class TestClientConfig:
+    def test_explicit_credentials_skip_tea(self):
+        with patch("app.gitea._get_tea_login") as tea:
+            client = GiteaClient(base_url="https://g.example.com", token="t")
+        client.close()
+        tea.assert_not_called()
+
+    def test_tea_fills_missing_token(self, monkeypatch):
+        monkeypatch.delenv("GITEA_TOKEN", raising=False)
+        login = {"url": "https://tea.example.com", "token": "tea-token"}
+        with patch("app.gitea._get_tea_login", return_value=login):
+            client = GiteaClient(base_url="https://g.example.com")
+        client.close()
+        assert client.base_url == "https://g.example.com"
+        assert client.token == "tea-token"
+
+    def test_get_client_builds_one_client_per_repo(self, monkeypatch):
+        monkeypatch.setenv("GITEA_URL", "https://cache.example.com")
+        monkeypatch.setenv("GITEA_TOKEN", "t")
+        try:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                clients = list(pool.map(lambda _: get_client("o", "r"), range(16)))
+            assert all(c is clients[0] for c in clients)
+            assert get_client("o", "other") is not clients[0]
+        finally:
+            close_all_clients()
+
+
+class TestGetEpicColor:
+    def test_no_epic(self):
+        assert get_epic_color(None) == "transparent"
+        assert get_epic_color("") == "transparent"
+
+    def test_stable_and_distinct(self):
+        auth = get_epic_color("auth")
+        assert get_epic_color("billing") != auth
+        assert get_epic_color("auth") == auth
+
+    def test_independent_of_call_order(self):
+        auth = get_epic_color("auth")
+        get_epic_color.cache_clear()
+        for i in range(20):
+            get_epic_color(f"epic-{i}")
+        assert get_epic_color("auth") == auth
+        assert auth in EPIC_COLORS
+
+
+class TestToBoardIssue:
+    def test_skips_dependencies_when_payload_reports_none(self, gitea_factory):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(200, json=[_dep(7)])
+
+        client = gitea_factory(handler)
+        board_issue = client.to_board_issue(_issue(number=1, dependency_count=0))
+        assert (board_issue.blocked_by_count, board_issue.blocks_count) == (0, 1)
+        assert paths == ["/api/v1/repos/owner/repo/issues/1/blocks"]
+
+    def test_unknown_count_fetches_dependencies(self, gitea_factory):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            return httpx.Response(200, json=[_dep(7)])
+
+        client = gitea_factory(handler)
+        board_issue = client.to_board_issue(_issue(number=1))
+        assert board_issue.blocked_by_count == 1
+        assert len(paths) == 2
+
+
+def _issue_payload(number: int, state: str = "open", labels: tuple[str, ...] = ()):
+    return {
+        "number": number,
+        "title": f"Issue {number}",
+        "state": state,
+        "labels": [{"name": name} for name in labels],
+        "created_at": "2026-01-01T00:00:00Z",
+        "updated_at": "2026-01-01T00:00:00Z",
+        "closed_at": None,
+        "body": "",
+    }
+
+
+def _milestone_payload(mid: int, title: str, state: str, description: str = ""):
+    return {
+        "id": mid,
+        "title": title,
+        "state": state,
+        "open_issues": 0,
+        "closed_issues": 0,
+        "created_at": "2026-01-01T00:00:00Z",
+        "description": description,
+    }
+
+
+class TestGetIssuesPagination:
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        _issues_cache.clear()
+        yield
+        _issues_cache.clear()
+
+    def _handler(self, total: int, pages_seen: list, send_total: bool = True):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            pages_seen.append(page)
+            start = (page - 1) * PAGE_LIMIT
+            numbers = range(start + 1, min(start + PAGE_LIMIT, total) + 1)
+            headers = {"X-Total-Count": str(total)} if send_total else {}
+            return httpx.Response(
+                200, json=[_issue_payload(n) for n in numbers], headers=headers
+            )
+
+        return handler
+
+    def test_requests_issues_only(self, gitea_factory):
+        params = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            params.append(dict(request.url.params))
+            return httpx.Response(200, json=[])
+
+        gitea_factory(handler)._get_issues(state="open", labels="ready")
+        assert params == [
+            {
+                "state": "open",
+                "type": "issues",
+                "limit": str(PAGE_LIMIT),
+                "labels": "ready",
+                "page": "1",
+            }
+        ]
+
+    def test_uses_total_count(self, gitea_factory):
+        pages = []
+        client = gitea_factory(self._handler(PAGE_LIMIT * 3 + 7, pages))
+        issues = client._get_issues(state="all")
+        assert [i.number for i in issues] == list(range(1, PAGE_LIMIT * 3 + 8))
+        assert sorted(pages) == [1, 2, 3, 4]
+
+    def test_exact_multiple_stops_at_total(self, gitea_factory):
+        pages = []
+        client = gitea_factory(self._handler(PAGE_LIMIT * 2, pages))
+        assert len(client._get_issues(state="all")) == PAGE_LIMIT * 2
+        assert sorted(pages) == [1, 2]
+
+    def test_exact_multiple_without_total_checks_next_page(self, gitea_factory):
+        pages = []
+        client = gitea_factory(self._handler(PAGE_LIMIT * 2, pages, send_total=False))
+        assert len(client._get_issues(state="all")) == PAGE_LIMIT * 2
+        assert pages == [1, 2, 3]
+
+    def test_without_total_count(self, gitea_factory):
+        pages = []
+        client = gitea_factory(self._handler(PAGE_LIMIT + 1, pages, send_total=False))
+        assert len(client._get_issues(state="all")) == PAGE_LIMIT + 1
+        assert pages == [1, 2]
+
+    def test_truncated_at_max_pages(self, gitea_factory):
+        pages = []
+        client = gitea_factory(self._handler(PAGE_LIMIT * 5, pages))
+        with pytest.warns(UserWarning, match="truncated"):
+            issues = client._get_issues(state="all", max_pages=2)
+        assert len(issues) == PAGE_LIMIT * 2
+        assert sorted(pages) == [1, 2]
+
+
+class TestConcurrentIssueFetch:
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        _issues_cache.clear()
+        yield
+        _issues_cache.clear()
+
+    def test_concurrent_misses_share_one_fetch(self, gitea_factory):
+        release = threading.Event()
+        requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            release.wait(timeout=5)
+            return httpx.Response(200, json=[_issue_payload(1)])
+
+        client = gitea_factory(handler)
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            futures = [pool.submit(client._get_issues) for _ in range(3)]
+            while not requests:
+                time.sleep(0.01)
+            time.sleep(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert len(requests) == 1
+        assert results[0] is results[1] is results[2]
+        assert not _issues_inflight
+
+    def test_failure_reaches_waiters_and_is_not_cached(self, gitea_factory):
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request)
+            return httpx.Response(500 if len(calls) == 1 else 200, json=[])
+
+        client = gitea_factory(handler)
+        with pytest.raises(GiteaError):
+            client._get_issues()
+        assert client._get_issues() == []
+        assert not _issues_inflight
+
+
+class TestToBoardIssues:
+    def test_prefetches_all_dependencies(self, gitea_factory):
+        paths = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            paths.append(request.url.path)
+            if request.url.path.endswith("/dependencies"):
+                return httpx.Response(200, json=[_dep(99)])
+            return httpx.Response(200, json=[])
+
+        client = gitea_factory(handler)
+        issues = [_issue(number=n) for n in (1, 2, 3)]
+        board_issues = client.to_board_issues(issues)
+
+        assert [bi.number for bi in board_issues] == [1, 2, 3]
+        assert all(bi.blocked_by_count == 1 for bi in board_issues)
+        assert len(paths) == 6
+
+        # Everything is cached now
+        client.to_board_issues(issues)
+        assert len(paths) == 6
+
+    def test_failed_prefetch_falls_back(self, gitea_factory):
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(500)
+
+        client = gitea_factory(handler)
+        board_issues = client.to_board_issues([_issue(number=1)])
+        assert board_issues[0].blocked_by_count == 0
+        assert not _deps_cache
+
+    def test_without_deps(self, gitea_factory):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise AssertionError("no requests expected")
+
+        client = gitea_factory(handler)
+        board_issues = client.to_board_issues([_issue(number=1)], fetch_deps=False)
+        assert board_issues[0].blocked_by_count == 0
+
+
+def _milestone(title: str, state: str = "open", description: str = "") -> Milestone:
+    return Milestone(
+        id=1,
+        title=title,
+        state=state,
+        open_issues=0,
+        closed_issues=0,
+        created_at="2026-01-01T00:00:00Z",
+        description=description,
+    )
+
+
+class TestMilestone:
+    def test_parsed_fields(self):
+        m = _milestone("Sprint 12", description="start_date: 2026-03-02\nnotes")
+        assert m.sprint_number == 12
+        assert m.start_date == date(2026, 3, 2)
+
+    def test_non_sprint_title(self):
+        m = _milestone("Release 1.0")
+        assert m.sprint_number is None
+        assert m.start_date is None
+
+    def test_equality_ignores_derived_fields(self):
+        assert _milestone("Sprint 1") == _milestone("Sprint 1")
+
+
+class TestCurrentSprintNumber:
+    def test_prefers_lowest_in_progress(self):
+        milestones = [
+            _milestone("Sprint 7", description="start_date: 2020-01-20"),
+            _milestone("Sprint 5", description="start_date: 2020-01-06"),
+            _milestone("Sprint 3"),
+        ]
+        assert _current_sprint_number(milestones) == 5
+
+    def test_falls_back_to_lowest_planned(self):
+        milestones = [
+            _milestone("Sprint 9", description="start_date: 2999-01-01"),
+            _milestone("Sprint 8"),
+            _milestone("Sprint 2", state="closed"),
+        ]
+        assert _current_sprint_number(milestones) == 8
+
+    def test_no_sprint_milestones(self):
+        assert _current_sprint_number([_milestone("Backlog")]) is None
+        assert _current_sprint_number([]) is None
+
+
+class TestClassifyLabels:
+    def test_all_fields(self):
+        info = _classify_labels(
+            ("bug", "sprint/12", "size/xl", "P2", "epic/auth", "ready", "needs-polish")
+        )
+        assert info.sprint == 12
+        assert info.size == "XL"
+        assert info.priority == 2
+        assert info.epic == "auth"
+        assert info.issue_type == "bug"
+        assert info.is_ready
+        assert info.needs_polish
+        assert not info.is_epic_tracking
+
+    def test_first_match_wins(self):
+        info = _classify_labels(
+            ("sprint/3", "sprint/4", "P3", "P1", "docs", "bug", "epic/a/b", "epic/c")
+        )
+        assert (info.sprint, info.priority, info.issue_type) == (3, 3, "docs")
+        assert info.epic == "a/b"
+
+    def test_no_labels(self):
+        info = _classify_labels(())
+        assert info.sprint is None
+        assert info.size is None
+        assert info.priority is None
+        assert info.epic is None
+        assert info.issue_type == "unknown"
+
+    def test_sprint_with_suffix(self):
+        assert _classify_labels(("sprint/x", "sprint/12-hotfix")).sprint == 12
+
+    def test_rejects_near_misses(self):
+        info = _classify_labels(("sprint/x", "P4", "P1x", "epic"))
+        assert info.sprint is None
+        assert info.priority is None
+        assert info.issue_type == "epic"
+        assert info.is_epic_tracking
+
+    def test_shared_label_sets_reuse_result(self):
+        first = _issue(labels=("sprint/7", "ready"), number=1)
+        second = _issue(labels=("sprint/7", "ready"), number=2)
+        assert first._labels is second._labels
+
+
+class TestSprint:
+    def test_stats(self):
+        sprint = Sprint(
+            number=1,
+            issues=(
+                _issue(number=1, labels=("size/s",)),
+                _issue(number=2, labels=("size/l",), state="closed"),
+                _issue(number=3, body="## Effort: M", state="closed"),
+                _issue(number=4),
+            ),
+        )
+        assert (sprint.open_count, sprint.closed_count, sprint.total) == (2, 2, 4)
+        assert sprint.total_points == 9
+        assert sprint.completed_points == 8
+        assert sprint.progress_pct == 50
+
+    def test_empty(self):
+        sprint = Sprint(number=1, issues=())
+        assert sprint.open_count == sprint.closed_count == 0
+        assert sprint.total_points == sprint.completed_points == 0
+        assert sprint.progress_pct == 0
+
+
+class TestConditionalRevalidation:
+    @pytest.fixture(autouse=True)
+    def _clear_caches(self):
+        caches = (
+            _issues_cache,
+            _issues_etag_cache,
+            _milestones_cache,
+            _milestones_etag_cache,
+        )
+        for cache in caches:
+            cache.clear()
+        yield
+        for cache in caches:
+            cache.clear()
+
+    def _issues_handler(self, pages: dict[int, list[int]], seen: list):
+        def handler(request: httpx.Request) -> httpx.Response:
+            page = int(request.url.params["page"])
+            etag = f'"p{page}-{len(pages.get(page, []))}"'
+            seen.append((page, request.headers.get("if-none-match")))
+            if request.headers.get("if-none-match") == etag:
+                return httpx.Response(304)
+            numbers = pages.get(page, [])
+            return httpx.Response(
+                200, json=[_issue_payload(n) for n in numbers], headers={"ETag": etag}
+            )
+
+        return handler
+
+    def test_unchanged_pages_reuse_cached_list(self, gitea_factory):
+        pages = {1: list(range(1, PAGE_LIMIT + 1)), 2: [PAGE_LIMIT + 1]}
+        seen = []
+        client = gitea_factory(self._issues_handler(pages, seen))
+
+        first = client._get_issues(state="all")
+        assert [p for p, _ in seen] == [1, 2]
+        assert all(etag is None for _, etag in seen)
+
+        _issues_cache.clear()  # simulate TTL expiry
+        seen.clear()
+        second = client._get_issues(state="all")
+        assert second is first
+        assert sorted(seen) == [(1, f'"p1-{PAGE_LIMIT}"'), (2, '"p2-1"')]
+
+    def test_changed_page_is_refetched(self, gitea_factory):
+        pages = {1: list(range(1, PAGE_LIMIT + 1)), 2: [PAGE_LIMIT + 1]}
+        seen = []
+        client = gitea_factory(self._issues_handler(pages, seen))
+        client._get_issues(state="all")
+
+        pages[2] = [PAGE_LIMIT + 1, PAGE_LIMIT + 2]
+        _issues_cache.clear()
+        issues = client._get_issues(state="all")
+        assert [i.number for i in issues][-2:] == [PAGE_LIMIT + 1, PAGE_LIMIT + 2]
+        assert len(issues) == PAGE_LIMIT + 2
+
+    def test_growth_past_known_pages(self, gitea_factory):
+        pages = {1: list(range(1, PAGE_LIMIT + 1))}
+        seen = []
+        client = gitea_factory(self._issues_handler(pages, seen))
+        assert len(client._get_issues(state="all")) == PAGE_LIMIT
+
+        pages[2] = [PAGE_LIMIT + 1]
+        _issues_cache.clear()
+        assert len(client._get_issues(state="all")) == PAGE_LIMIT + 1
+
+    def test_pages_persist_across_restart(self, gitea_factory, tmp_path):
+        pages = {1: list(range(1, PAGE_LIMIT + 1)), 2: [PAGE_LIMIT + 1]}
+        seen = []
+        client = gitea_factory(self._issues_handler(pages, seen))
+        store = _IssuePageStore(str(tmp_path / "http-cache.db"))
+        with patch("app.gitea._issue_page_store", store):
+            first = client._get_issues(state="all")
+            # Simulate a restart: both in-memory layers are empty
+            _issues_cache.clear()
+            _issues_etag_cache.clear()
+            seen.clear()
+            second = client._get_issues(state="all")
+
+        assert [i.number for i in second] == [i.number for i in first]
+        assert sorted(seen) == [(1, f'"p1-{PAGE_LIMIT}"'), (2, '"p2-1"')]
+
+    def test_store_drops_pages_past_new_end(self, tmp_path):
+        store = _IssuePageStore(str(tmp_path / "http-cache.db"))
+        body = orjson.dumps([_issue_payload(1)])
+        store.save("q", 2, {1: ('"a"', "2", body), 2: ('"b"', "2", body)})
+        store.save("q", 1, {})
+        stored = store.load("q")
+        assert stored is not None
+        assert [page.etag for page in stored] == ['"a"']
+        assert store.load("other") is None
+
+    def test_milestones_not_modified(self, gitea_factory):
+        seen = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request.headers.get("if-none-match"))
+            if request.headers.get("if-none-match") == '"m1"':
+                return httpx.Response(304)
+            return httpx.Response(
+                200,
+                json=[_milestone_payload(1, "Sprint 1", "open")],
+                headers={"ETag": '"m1"'},
+            )
+
+        client = gitea_factory(handler)
+        first = client.get_milestones()
+        _milestones_cache.clear()
+        assert client.get_milestones() is first
+        assert seen == [None, '"m1"']
+
+
+class TestEnvTtl:
+    def test_default_when_unset(self, monkeypatch):
+        monkeypatch.delenv("SPRINT_DASH_TEST_TTL", raising=False)
+        assert env_ttl("SPRINT_DASH_TEST_TTL", 60) == 60
+
+    def test_reads_value(self, monkeypatch):
+        monkeypatch.setenv("SPRINT_DASH_TEST_TTL", "2.5")
+        assert env_ttl("SPRINT_DASH_TEST_TTL", 60) == 2.5
+
+    @pytest.mark.parametrize("raw", ["abc", "0", "-5"])
+    def test_invalid_falls_back(self, monkeypatch, raw):
+        monkeypatch.setenv("SPRINT_DASH_TEST_TTL", raw)
+        assert env_ttl("SPRINT_DASH_TEST_TTL", 60) == 60
+
+
+class TestGetJson:
+    def test_get_issue(self, gitea_factory):
+        client = gitea_factory(
+            lambda request: httpx.Response(200, json=_issue_payload(5))
+        )
+        assert client.get_issue(5).number == 5
+
+    def test_http_error_raises(self, gitea_factory):
+        client = gitea_factory(lambda request: httpx.Response(500))
+        with pytest.raises(GiteaError, match="500"):
+            client.get_issue(5)
+
+    def test_network_error_raises(self, gitea_factory):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        client = gitea_factory(handler)
+        with pytest.raises(GiteaError, match="Network error"):
+            client.get_issue_comments(5)
+
+    def test_missing_dependencies_are_empty(self, gitea_factory):
+        client = gitea_factory(lambda request: httpx.Response(404))
+        assert client.get_issue_dependencies(5) == []
+        assert client.get_issue_blocks(5) == []
+        with pytest.raises(GiteaError, match="404"):
+            client.get_issue(5)
+
+
+class TestParseIssue:
+    def test_null_labels(self):
+        payload = _issue_payload(3)
+        payload["labels"] = None
+        issue = _parse_issue(payload)
+        assert issue.labels == ()
+        assert issue.sprint is None
+
+    def test_dependency_count(self):
+        payload = _issue_payload(3)
+        assert _parse_issue(payload).dependency_count is None
+        payload["dependencies_count"] = 0
+        assert _parse_issue(payload).dependency_count == 0
+
+    def test_labels_interned(self):
+        first = _parse_issue(
+            orjson.loads(orjson.dumps(_issue_payload(1, labels=("ready",))))
+        )
+        second = _parse_issue(
+            orjson.loads(orjson.dumps(_issue_payload(2, labels=("ready",))))
+        )
+        assert first.labels[0] is second.labels[0]
+
+
+class TestBacklogStats:
+    def test_aggregates(self):
+        stats = BacklogStats(
+            issues=[
+                _issue(number=1, labels=("size/s", "epic/auth")),
+                _issue(number=2, labels=("size/xl", "epic/auth")),
+                _issue(number=3, labels=("epic/billing",), body="**Effort:** M"),
+                _issue(number=4),
+            ]
+        )
+        assert stats.total_count == 4
+        assert stats.total_points == 12
+        assert stats.size_counts == {"S": 1, "M": 1, "L": 0, "XL": 1, "?": 1}
+        assert [n for n, _ in stats.epics_sorted] == ["auth", "billing", None]
+        assert [i.number for i in stats.by_epic["auth"]] == [1, 2]
+
+    def test_empty(self):
+        stats = BacklogStats(issues=[])
+        assert stats.total_points == 0
+        assert stats.size_counts == {"S": 0, "M": 0, "L": 0, "XL": 0, "?": 0}
+        assert stats.epics_sorted == []
+
+    def test_unknown_size_label(self):
+        stats = BacklogStats(issues=[_issue(labels=("size/xxl",))])
+        assert stats.size_counts["XXL"] == 1
+        assert stats.total_points == 0
+
+
+class TestClientHeaders:
+    def test_advertises_compression(self):
+        client = GiteaClient(
+            base_url="https://gitea.example.com", token="t", owner="o", repo="r"
+        )
+        try:
+            encodings = client._client.headers["accept-encoding"]
+        finally:
+            client.close()
+        assert "gzip" in encodings
+        assert "br" in encodings
+
+
+class TestSharedHttpClient:
+    def _client(self, token: str = "shared-token", **kwargs) -> GiteaClient:
+        return GiteaClient(base_url="https://shared.example.com", token=token, **kwargs)
+
+    def test_repos_share_one_connection_pool(self):
+        first = self._client(owner="o", repo="a")
+        second = self._client(owner="o", repo="b")
+        other_token = self._client(token="other-token", owner="o", repo="a")
+        try:
+            assert first._client is second._client
+            assert other_token._client is not first._client
+        finally:
+            for client in (first, second, other_token):
+                client.close()
+
+    def test_closed_with_last_reference(self):
+        first = self._client(owner="o", repo="a")
+        second = self._client(owner="o", repo="b")
+        http = first._client
+        first.close()
+        assert not http.is_closed
+        first.close()  # idempotent: doesn't drop second's reference
+        assert not http.is_closed
+        second.close()
+        assert http.is_closed
+        assert all(shared.client is not http for shared in _http_clients.values())
+
+    def test_new_client_after_all_closed(self):
+        first = self._client()
+        http = first._client
+        first.close()
+        second = self._client()
+        try:
+            assert second._client is not http
+            assert not second._client.is_closed
+        finally:
+            second.close()
+
+
+class TestSearchIssues:
+    @pytest.fixture()
+    def client(self, gitea_factory):
+        _issues_cache.clear()
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            return httpx.Response(200, json=[_issue_payload(n) for n in (1, 12)])
+
+        yield gitea_factory(handler)
+        _issues_cache.clear()
+
+    @pytest.mark.parametrize("query", ["1", "#1", "  #1 "])
+    def test_number_query(self, client, query):
+        assert [i.number for i in client.search_issues(query)] == [1]
+
+    def test_title_index_reused(self, client):
+        issues = client._get_issues()
+        client.search_issues("issue")
+        assert _title_index[id(issues)][0] is issues
+        assert _title_index[id(issues)][1] == ["issue 1", "issue 12"]
+
+    def test_title_query(self, client):
+        assert [i.number for i in client.search_issues("ISSUE 1")] == [1, 12]
+        assert [i.number for i in client.search_issues("#1x")] == []
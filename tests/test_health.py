@@ -0,0 +1,51 @@
+"""Tests for the health check endpoint."""
+
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import app.health as health
+
+
+@pytest.fixture()
+def conn(monkeypatch):
+    """Stub database connection; resets the cached probe around each test."""
+    conn = MagicMock()
+    monkeypatch.setattr(health, "get_db", lambda: conn)
+    monkeypatch.setattr(health, "_last_probe", None)
+    return conn
+
+
+@pytest.fixture()
+def client(conn):
+    from app.main import app
+
+    return TestClient(app)
+
+
+def test_healthy(client, conn):
+    resp = client.get("/health")
+    assert resp.status_code == 200
+    assert resp.json() == {"status": "ok", "git_sha": health.GIT_SHA, "db": "ok"}
+
+
+def test_probe_reused_within_ttl(client, conn):
+    client.get("/health")
+    client.get("/health")
+    assert conn.execute.call_count == 1
+
+
+def test_probe_repeated_after_ttl(client, conn, monkeypatch):
+    client.get("/health")
+    monkeypatch.setattr(health, "DB_PROBE_TTL", 0)
+    client.get("/health")
+    assert conn.execute.call_count == 2
+
+
+def test_db_error_degrades(client, conn):
+    conn.execute.side_effect = RuntimeError("database is locked")
+    resp = client.get("/health")
+    assert resp.status_code == 503
+    assert resp.json()["status"] == "degraded"
+    assert resp.json()["db"] == "error"
@@ -57,6 +57,11 @@ class TestListSprints:
         assert len(planned) == 1
         assert planned[0]["number"] == 2
 
+    def test_limit(self, sd_client):
+        for n in (1, 2, 3):
+            sd_client.create_sprint(n)
+        assert [s["number"] for s in sd_client.list_sprints(limit=1)] == [3]
+
 
 class TestGetSprint:
     def test_found(self, sd_client):
@@ -185,6 +190,142 @@ class TestIssueOperations:
         assert sd_client.get_issue_numbers(99) == []
 
 
+class TestBatchIssueOperations:
+    def test_add_issues(self, sd_client):
+        sd_client.create_sprint(1)
+        assert sd_client.add_issues(1, [10, 20]) == ([10, 20], [])
+        assert sd_client.get_issue_numbers(1) == [10, 20]
+
+    def test_add_issues_sprint_not_found(self, sd_client):
+        assert sd_client.add_issues(99, [10, 20]) == ([], [10, 20])
+
+    def test_add_issues_empty(self, sd_client):
+        assert sd_client.add_issues(1, []) == ([], [])
+
+    def test_remove_issues_partial(self, sd_client):
+        sd_client.create_sprint(1)
+        sd_client.add_issues(1, [10, 20])
+        assert sd_client.remove_issues(1, [10, 99]) == ([10], [99])
+        assert sd_client.get_issue_numbers(1) == [20]
+
+    def test_move_issues_skips_missing(self, sd_client):
+        sd_client.create_sprint(1)
+        sd_client.create_sprint(2)
+        sd_client.add_issues(1, [10, 20])
+        assert sd_client.move_issues([10, 99, 20], 1, 2) == ([10, 20], [99])
+        assert sd_client.get_issue_numbers(2) == [10, 20]
+
+    def test_move_issues_all_missing(self, sd_client):
+        sd_client.create_sprint(1)
+        sd_client.create_sprint(2)
+        assert sd_client.move_issues([99], 1, 2) == ([], [99])
+
+    def test_batch_is_one_request(self, test_client):
+        paths = []
+
+        def record(request):
+            paths.append(request.url.path)
+
+        client = SprintDashClient(
+            "http://testserver",
+            "testowner",
+            "testrepo",
+            transport=test_client._transport,
+            event_hooks={"request": [record]},
+        )
+        try:
+            client.create_sprint(1)
+            paths.clear()
+            client.add_issues(1, [10, 20, 30])
+            client.remove_issues(1, [10, 20])
+        finally:
+            client.close()
+        assert paths == [
+            "/testowner/testrepo/api/v1/sprints/1/issues",
+            "/testowner/testrepo/api/v1/sprints/1/issues/remove",
+        ]
+
+
+class TestResponseCache:
+    @pytest.fixture()
+    def counted(self, test_client):
+        requests = []
+        client = SprintDashClient(
+            "http://testserver",
+            "testowner",
+            "testrepo",
+            transport=test_client._transport,
+            event_hooks={"request": [requests.append]},
+        )
+        yield client, requests
+        client.close()
+
+    def test_repeated_reads_hit_cache(self, counted):
+        client, requests = counted
+        client.create_sprint(1)
+        client.start_sprint(1)
+        requests.clear()
+        assert client.get_snapshot(1, "start") is not None
+        assert client.get_snapshot(1, "end") is None
+        assert len(requests) == 1
+
+    def test_writes_invalidate(self, counted):
+        client, requests = counted
+        client.create_sprint(1)
+        assert client.get_issue_numbers(1) == []
+        client.add_issue(1, 10)
+        assert client.get_issue_numbers(1) == [10]
+
+    def test_params_are_part_of_key(self, counted):
+        client, _ = counted
+        client.create_sprint(1)
+        client.create_sprint(2)
+        client.start_sprint(2)
+        assert len(client.list_sprints()) == 2
+        assert len(client.list_sprints(status="planned")) == 1
+
+    def test_disabled(self, test_client):
+        requests = []
+        client = SprintDashClient(
+            "http://testserver",
+            "testowner",
+            "testrepo",
+            transport=test_client._transport,
+            cache_ttl=0,
+            event_hooks={"request": [requests.append]},
+        )
+        try:
+            client.create_sprint(1)
+            requests.clear()
+            client.get_sprint(1)
+            client.get_sprint(1)
+        finally:
+            client.close()
+        assert len(requests) == 2
+
+    def test_revalidates_with_etag(self, test_client):
+        statuses = []
+        client = SprintDashClient(
+            "http://testserver",
+            "testowner",
+            "testrepo",
+            transport=test_client._transport,
+            cache_ttl=0,
+            event_hooks={"response": [lambda r: statuses.append(r.status_code)]},
+        )
+        try:
+            client.create_sprint(1, goal="demo")
+            statuses.clear()
+            first = client.get_sprint(1)
+            second = client.get_sprint(1)
+        finally:
+            client.close()
+        assert statuses == [200, 304]
+        assert first == second
+        assert second is not None
+        assert second["goal"] == "demo"
+
+
 class TestGetSnapshot:
     def test_snapshot_via_get_sprint(self, sd_client):
         sd_client.create_sprint(1)
@@ -245,3 +386,23 @@ class TestApiValidation:
         with pytest.raises(SprintDashError) as exc_info:
             sd_client.create_sprint(1, start_date="not-a-date")
         assert exc_info.value.status == 422
+
+
+class TestTransport:
+    def test_default_transport_pools_and_negotiates_http2(self):
+        client = SprintDashClient("https://sd.example.com", "o", "r", max_connections=5)
+        try:
+            pool = client._client._transport._pool
+            assert pool._http2 is True
+            assert pool._max_connections == 5
+        finally:
+            client.close()
+
+    def test_explicit_transport_used_as_is(self):
+        transport = httpx.MockTransport(lambda request: httpx.Response(200, json=[]))
+        client = SprintDashClient("http://sd", "o", "r", transport=transport)
+        try:
+            assert client._client._transport is transport
+            assert client.list_sprints() == []
+        finally:
+            client.close()
@@ -0,0 +1,239 @@
+"""Tests for page-route helpers in app.main."""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from cachetools import TTLCache
+from starlette.datastructures import Headers
+
+from app import main
+from app.database import get_connection, init_schema
+from app.sprint_store import SprintStore
+
+
+@pytest.fixture()
+def db(tmp_path):
+    conn = get_connection(str(tmp_path / "board.db"))
+    init_schema(conn)
+    yield conn
+    conn.close()
+
+
+@pytest.fixture()
+def store(db):
+    return SprintStore(db, "owner", "repo")
+
+
+@pytest.fixture()
+def client():
+    client = MagicMock()
+    client.base_url = "https://gitea.example.com"
+    return client
+
+
+@pytest.fixture(autouse=True)
+def clear_board_cache():
+    main._board_cache.clear()
+    main._board_locks.clear()
+    yield
+    main._board_cache.clear()
+    main._board_locks.clear()
+
+
+class TestGetBoardData:
+    async def test_reused_while_db_unchanged(self, store, client):
+        with patch.object(main, "_build_board_data") as build:
+            first = await main._get_board_data(store, client)
+            second = await main._get_board_data(store, client)
+        assert first is second
+        build.assert_called_once()
+
+    async def test_rebuilt_after_write(self, store, client):
+        with patch.object(main, "_build_board_data") as build:
+            await main._get_board_data(store, client)
+            store.create_sprint(1)
+            await main._get_board_data(store, client)
+        assert build.call_count == 2
+
+    async def test_rebuilt_after_other_connection_writes(self, tmp_path, store, client):
+        other = get_connection(str(tmp_path / "board.db"))
+        try:
+            with patch.object(main, "_build_board_data") as build:
+                await main._get_board_data(store, client)
+                SprintStore(other, "owner", "repo").create_sprint(1)
+                await main._get_board_data(store, client)
+        finally:
+            other.close()
+        assert build.call_count == 2
+
+    async def test_expires_after_ttl(self, store, client, monkeypatch):
+        now = [0.0]
+        monkeypatch.setattr(
+            main, "_board_cache", TTLCache(maxsize=4, ttl=5, timer=lambda: now[0])
+        )
+        with patch.object(main, "_build_board_data") as build:
+            await main._get_board_data(store, client)
+            now[0] = 6.0
+            await main._get_board_data(store, client)
+        assert build.call_count == 2
+
+    async def test_cache_and_locks_are_bounded(self, db, client):
+        with patch.object(main, "_build_board_data"):
+            for i in range(main._board_cache.maxsize + 5):
+                await main._get_board_data(SprintStore(db, "owner", f"r{i}"), client)
+        assert len(main._board_cache) == main._board_cache.maxsize
+        assert len(main._board_locks) == main._board_locks.maxsize
+
+    async def test_concurrent_cold_requests_build_once(self, store, client):
+        with patch.object(main, "_build_board_data") as build:
+            first, second = await asyncio.gather(
+                main._get_board_data(store, client),
+                main._get_board_data(store, client),
+            )
+        assert first is second
+        build.assert_called_once()
+
+    async def test_version_taken_after_prefetch(self, store, client):
+        async def prefetch_then_write(*_args):
+            store.create_sprint(1)
+
+        with (
+            patch.object(main, "_prefetch_issues", prefetch_then_write),
+            patch.object(main, "_build_board_data") as build,
+        ):
+            await main._get_board_data(store, client)
+            await main._get_board_data(store, client)
+        build.assert_called_once()
+
+    async def test_keyed_by_repo(self, db, store, client):
+        with patch.object(main, "_build_board_data") as build:
+            await main._get_board_data(store, client)
+            await main._get_board_data(SprintStore(db, "owner", "other"), client)
+        assert build.call_count == 2
+
+
+class TestFetchCi:
+    def test_not_configured(self):
+        assert main._fetch_ci(None, "owner", "repo") == (None, None)
+
+    def test_failures_are_swallowed(self):
+        wp = MagicMock()
+        wp.get_ci_health.side_effect = RuntimeError("down")
+        wp.get_nightly_summary.return_value = "nightly"
+        assert main._fetch_ci(wp, "owner", "repo") == (None, "nightly")
+
+    async def test_runs_off_the_event_loop(self):
+        wp = MagicMock()
+        wp.get_ci_health.side_effect = lambda *_: threading.get_ident()
+        with patch.object(main, "get_woodpecker_client", return_value=wp):
+            ci_health, _ = await main._start_ci_fetch("owner", "repo")
+        assert ci_health != threading.get_ident()
+
+
+def _issue(number, **kwargs):
+    fields = {
+        "state": "open",
+        "is_ready": True,
+        "issue_type": "feature",
+        "epic": None,
+        "priority": None,
+        "size": None,
+        "created_at": f"2026-01-{number:02d}",
+    }
+    fields.update(kwargs)
+    return SimpleNamespace(number=number, **fields)
+
+
+class TestFilterBoardIssues:
+    def test_filters_in_one_pass(self):
+        issues = [
+            _issue(1, issue_type="bug"),
+            _issue(2, epic="auth"),
+            _issue(3, state="closed", epic="auth"),
+            _issue(4, epic="auth", is_ready=False),
+        ]
+        result = main._filter_board_issues(issues, epic_filter="auth")
+        assert [i.number for i in result] == [2, 4]
+        result = main._filter_board_issues(
+            issues, epic_filter="auth", show_closed=True, ready_only=True
+        )
+        assert [i.number for i in result] == [2, 3]
+        result = main._filter_board_issues(issues, type_filter="bug")
+        assert [i.number for i in result] == [1]
+
+    def test_sorted_for_display(self):
+        issues = [
+            _issue(1, state="closed", priority=1),
+            _issue(2, priority=2, size="S"),
+            _issue(3, priority=2, size="L"),
+            _issue(4, priority=1),
+        ]
+        result = main._filter_board_issues(issues, show_closed=True)
+        assert [i.number for i in result] == [4, 3, 2, 1]
+
+
+class TestOpenFlagCounts:
+    def test_counts_open_only(self):
+        issues = [
+            SimpleNamespace(state="open", is_blocked=True, needs_polish=False),
+            SimpleNamespace(state="open", is_blocked=True, needs_polish=True),
+            SimpleNamespace(state="closed", is_blocked=True, needs_polish=True),
+        ]
+        assert main._open_flag_counts(issues) == (2, 1)
+
+
+class TestCompression:
+    def test_large_responses_are_gzipped(self):
+        from fastapi.testclient import TestClient
+
+        resp = TestClient(main.app).get(
+            "/openapi.json", headers={"Accept-Encoding": "gzip"}
+        )
+        assert resp.status_code == 200
+        assert resp.headers["content-encoding"] == "gzip"
+
+
+class TestStreamTemplate:
+    async def test_streams_rendered_template(self):
+        resp = main.stream_template("partials/error.html", {"error": "boom"})
+        assert resp.media_type == "text/html"
+        assert resp.headers["vary"] == "HX-Request"
+        body = "".join([chunk async for chunk in resp.body_iterator])
+        assert "boom" in body
+
+
+class TestConditionalTemplate:
+    def _request(self, if_none_match=None):
+        headers = {"If-None-Match": if_none_match} if if_none_match else {}
+        return SimpleNamespace(headers=Headers(headers))
+
+    def test_sets_etag_and_returns_304_on_match(self):
+        ctx = {"error": "boom"}
+        resp = main.conditional_template(self._request(), "partials/error.html", ctx)
+        assert resp.status_code == 200
+        assert b"boom" in resp.body
+        etag = resp.headers["etag"]
+        assert etag.startswith('W/"')
+        assert resp.headers["vary"] == "HX-Request"
+
+        resp = main.conditional_template(
+            self._request(etag), "partials/error.html", ctx
+        )
+        assert resp.status_code == 304
+        assert resp.body == b""
+        assert resp.headers["vary"] == "HX-Request"
+
+    def test_changed_content_gets_new_etag(self):
+        first = main.conditional_template(
+            self._request(), "partials/error.html", {"error": "a"}
+        )
+        second = main.conditional_template(
+            self._request(first.headers["etag"]),
+            "partials/error.html",
+            {"error": "b"},
+        )
+        assert second.status_code == 200
+        assert second.headers["etag"] != first.headers["etag"]
@@ -181,6 +181,12 @@ class TestListSprints:
         assert len(result) == 2
         assert all(r["status"] == "completed" for r in result)
 
+    def test_list_with_limit(self, store):
+        for n in (45, 46, 47):
+            _create_sprint_in_status(store, n, "completed")
+        result = store.list_sprints(status="completed", limit=2)
+        assert [r["number"] for r in result] == [47, 46]
+
     def test_list_empty(self, store):
         assert store.list_sprints() == []
 
@@ -428,6 +434,47 @@ class TestMoveIssue:
         assert store.get_issue_numbers(48) == [100]  # Still just one
 
 
+class TestBatchIssueOperations:
+    def test_add_issues(self, store):
+        store.create_sprint(47)
+        assert store.add_issues(47, [100, 101]) == ([100, 101], [])
+        assert store.add_issues(999, [100]) == ([], [100])
+
+    def test_remove_issues(self, store):
+        store.create_sprint(47)
+        store.add_issues(47, [100, 101])
+        assert store.remove_issues(47, [100, 102]) == ([100], [102])
+        assert store.get_issue_numbers(47) == [101]
+
+    def test_move_issues(self, store):
+        store.create_sprint(47)
+        store.create_sprint(48)
+        store.add_issues(47, [100, 101])
+        assert store.move_issues([100, 102], 47, 48) == ([100], [102])
+        assert store.get_issue_numbers(48) == [100]
+
+    def test_move_issues_failure_rolls_back_whole_batch(self, store, monkeypatch):
+        store.create_sprint(47)
+        store.create_sprint(48)
+        store.add_issues(47, [100, 101, 102])
+
+        real_insert = store._insert_issue
+
+        def flaky_insert(sprint_id, issue_number, source):
+            if issue_number == 101:
+                raise sqlite3.OperationalError("disk I/O error")
+            real_insert(sprint_id, issue_number, source)
+
+        monkeypatch.setattr(store, "_insert_issue", flaky_insert)
+        with pytest.raises(sqlite3.OperationalError):
+            store.move_issues([100, 101, 102], 47, 48)
+
+        # Issue 100 was moved before the failure; it must be back in 47
+        assert store.get_issue_numbers(47) == [100, 101, 102]
+        assert store.get_issue_numbers(48) == []
+        assert not store.conn.in_transaction
+
+
 class TestStartSprint:
     def test_start_basic(self, store):
         store.create_sprint(47)
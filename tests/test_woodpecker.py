@@ -1,5 +1,6 @@
 """Tests for Woodpecker CI client."""
 
+import time
 from unittest.mock import MagicMock, patch
 
 import httpx
@@ -7,6 +8,8 @@ import pytest
 
 from app.gitea import CIHealth, NightlySummary
 from app.woodpecker import (
+    CI_POLL_INTERVAL,
+    CI_POLL_RETRY_INTERVAL,
     WoodpeckerClient,
     WoodpeckerError,
     _ci_health_cache,
@@ -47,14 +50,16 @@ class TestWoodpeckerClientInit:
     """Test WoodpeckerClient initialization."""
 
     def test_missing_url_raises(self):
-        with patch.dict("os.environ", {}, clear=True), pytest.raises(
-            WoodpeckerError, match="No Woodpecker URL"
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            pytest.raises(WoodpeckerError, match="No Woodpecker URL"),
         ):
             WoodpeckerClient(base_url="", token="tok")
 
     def test_missing_token_raises(self):
-        with patch.dict("os.environ", {}, clear=True), pytest.raises(
-            WoodpeckerError, match="No Woodpecker token"
+        with (
+            patch.dict("os.environ", {}, clear=True),
+            pytest.raises(WoodpeckerError, match="No Woodpecker token"),
         ):
             WoodpeckerClient(base_url="http://localhost:9090", token="")
 
@@ -338,6 +343,107 @@ class TestGetCIHealth:
         assert ci_url == "http://10.0.20.50:9090/repos/7/pipeline/42"
 
 
+class TestCIPoller:
+    """Test background CI health polling."""
+
+    @pytest.fixture()
+    def polling_client(self):
+        with patch("app.woodpecker.httpx.Client"):
+            client = WoodpeckerClient(
+                base_url="http://10.0.20.50:9090",
+                token="test-token",
+                poll=True,
+            )
+            client._client = MagicMock()
+            yield client
+            client.close()
+
+    def _healthy_responses(self, client):
+        detail = {"workflows": [{"name": "ci", "state": "success"}]}
+        pipelines = [{"number": 10, "commit": "abc12345def"}]
+
+        def get(path, params=None):
+            resp = MagicMock()
+            resp.raise_for_status = MagicMock()
+            if path.startswith("/repos/lookup/"):
+                resp.json.return_value = {"id": 1}
+            elif params is not None:
+                resp.json.return_value = pipelines
+            else:
+                resp.json.return_value = detail
+            return resp
+
+        client._client.get = MagicMock(side_effect=get)
+
+    def test_no_thread_without_poll(self, mock_client):
+        client, transport = mock_client
+        transport.get = MagicMock(side_effect=httpx.RequestError("boom"))
+        client.get_ci_health("singlis", "deckengine")
+        assert client._poller is None
+
+    def test_first_read_starts_poller(self, polling_client):
+        self._healthy_responses(polling_client)
+        result = polling_client.get_ci_health("singlis", "deckengine")
+        assert result.sha == "abc12345"
+        assert polling_client._poller is not None
+        assert polling_client._poller.is_alive()
+        assert ("singlis", "deckengine") in polling_client._watched
+
+    def test_poller_refreshes_cache(self, polling_client):
+        self._healthy_responses(polling_client)
+        with patch("app.woodpecker.CI_POLL_INTERVAL", 0.01):
+            polling_client.get_ci_health("singlis", "deckengine")
+            calls = polling_client._client.get.call_count
+            for _ in range(200):
+                if polling_client._client.get.call_count > calls:
+                    break
+                time.sleep(0.01)
+        assert polling_client._client.get.call_count > calls
+
+    def test_unread_repos_are_dropped(self, polling_client):
+        self._healthy_responses(polling_client)
+        with (
+            patch("app.woodpecker.CI_POLL_INTERVAL", 0.01),
+            patch("app.woodpecker.CI_WATCH_EXPIRY", 0),
+        ):
+            polling_client.get_ci_health("singlis", "deckengine")
+            for _ in range(200):
+                if not polling_client._watched:
+                    break
+                time.sleep(0.01)
+        assert polling_client._watched == {}
+
+    def test_repo_without_pipelines_polls_slowly(self, polling_client):
+        def get(path, params=None):
+            resp = MagicMock()
+            resp.raise_for_status = MagicMock()
+            resp.json.return_value = {"id": 1} if "/lookup/" in path else []
+            return resp
+
+        polling_client._client.get = MagicMock(side_effect=get)
+        polling_client.get_ci_health("singlis", "deckengine")
+        assert polling_client._poll_interval == CI_POLL_INTERVAL
+
+    def test_unknown_repo_polls_slowly(self, polling_client):
+        response = httpx.Response(404, request=httpx.Request("GET", "http://wp"))
+        polling_client._client.get = MagicMock(return_value=response)
+        polling_client.get_ci_health("singlis", "deckengine")
+        assert polling_client._poll_interval == CI_POLL_INTERVAL
+
+    def test_unreachable_woodpecker_retries_quickly(self, polling_client):
+        polling_client._client.get = MagicMock(side_effect=httpx.ConnectError("down"))
+        polling_client.get_ci_health("singlis", "deckengine")
+        assert polling_client._poll_interval == CI_POLL_RETRY_INTERVAL
+
+    def test_close_stops_poller(self, polling_client):
+        self._healthy_responses(polling_client)
+        polling_client.get_ci_health("singlis", "deckengine")
+        thread = polling_client._poller
+        polling_client.close()
+        assert thread is not None
+        assert not thread.is_alive()
+
+
 class TestGetNightlySummary:
     """Test nightly summary fetching from Woodpecker."""
 